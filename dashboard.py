@@ -1,58 +1,203 @@
 # dashboard.py
+import json
+import logging
+import threading
+import time
+
 import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output
+from flask import Response
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import plotly.express as px
 
+API_BASE_URL = "http://localhost:5000"
+REFRESH_INTERVAL = 60  # Seconds between backend polls
+REQUEST_TIMEOUT = 10   # Seconds before a backend request is abandoned
+STREAM_KEEPALIVE = 15  # Seconds between SSE keep-alive comments
+DEVICE_BROWSER_TOP_K = 20  # Bars shown in the device/browser chart, the rest are bucketed as "Other"
+
+
+class FraudStatsFetcher:
+    """
+    Polls the Flask backend from a single background thread and keeps the
+    latest aggregates in memory, so backend load does not depend on the
+    number of open dashboard sessions.
+    """
+
+    def __init__(self, base_url, interval=REFRESH_INTERVAL, timeout=REQUEST_TIMEOUT):
+        self.base_url = base_url
+        self.interval = interval
+        self.timeout = timeout
+
+        # One pooled session with retries shared by every backend request
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=2, max_retries=retries))
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=2, max_retries=retries))
+
+        self._etags = {}
+        self._payloads = {}
+        self._changed = threading.Condition()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.snapshot = None
+        self.version = 0
+
+    def _get(self, path, params=None):
+        """
+        Issues a conditional GET and returns (payload, changed). A 304 reuses
+        the cached payload; failures keep serving the last good payload.
+        """
+        headers = {}
+        if path in self._etags:
+            headers["If-None-Match"] = self._etags[path]
+
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                return self._payloads.get(path), False
+            if response.status_code != 200:
+                logging.error(f"Unexpected status {response.status_code} fetching {path}")
+                return self._payloads.get(path), False
+            payload = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logging.error(f"Error fetching {path}: {e}")
+            return self._payloads.get(path), False
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[path] = etag
+        self._payloads[path] = payload
+        return payload, True
+
+    def refresh(self):
+        stats, stats_changed = self._get("/fraud-stats", params={"top_k": DEVICE_BROWSER_TOP_K})
+        geolocation, geolocation_changed = self._get("/fraud-geolocation")
+
+        if stats_changed or geolocation_changed:
+            with self._changed:
+                self.snapshot = {
+                    "stats": stats,
+                    "geolocation": geolocation["geolocation"] if geolocation else None
+                }
+                self.version += 1
+                self._changed.notify_all()
+
+    def wait_for_update(self, version, timeout):
+        """
+        Blocks until the snapshot moves past `version` or `timeout` expires,
+        then returns the current (version, snapshot).
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout=timeout)
+            return self.version, self.snapshot
+
+    def _run(self):
+        while True:
+            # Keep polling whatever goes wrong: this thread is the only source of fresh data
+            try:
+                self.refresh()
+            except Exception as e:
+                logging.error(f"Error refreshing fraud stats: {e}")
+            time.sleep(self.interval)
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="fraud-stats-fetcher", daemon=True)
+                self._thread.start()
+
+
 # Initialize the Dash app
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
 
-# Fetch fraud stats from the Flask backend
-def fetch_fraud_stats():
-    response = requests.get("http://localhost:5000/fraud-stats")
-    if response.status_code == 200:
-        return response.json()
-    else:
-        return None
-
-# Layout for the dashboard
-app.layout = html.Div([
-    html.H1("Fraud Detection Dashboard", style={'text-align': 'center'}),
-    
-    # Summary Boxes
-    html.Div([
-        html.Div([
-            html.H3("Total Transactions"),
-            html.P(id="total-transactions", children="Loading...")
-        ], style={'width': '30%', 'display': 'inline-block', 'margin': '20px'}),
-        html.Div([
-            html.H3("Fraud Cases"),
-            html.P(id="fraud-cases", children="Loading...")
-        ], style={'width': '30%', 'display': 'inline-block', 'margin': '20px'}),
+fetcher = FraudStatsFetcher(API_BASE_URL)
+
+
+# Start polling on the first request, so only the process that serves pages
+# runs a fetcher (not the debug reloader's parent, nor a bare import)
+@app.server.before_request
+def start_fetcher():
+    fetcher.start()
+
+
+@app.server.route("/stats-stream")
+def stats_stream():
+    """
+    Server-Sent Events stream that pushes the shared snapshot to a client
+    only when the backend aggregates change.
+    """
+    def events():
+        version = 0
+        while True:
+            new_version, snapshot = fetcher.wait_for_update(version, timeout=STREAM_KEEPALIVE)
+            if new_version == version or snapshot is None:
+                yield ": keep-alive\n\n"
+                continue
+            version = new_version
+            yield f"event: stats\ndata: {json.dumps(snapshot)}\n\n"
+
+    return Response(events(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+# Layout for the dashboard, rebuilt per page load so new sessions start from the cached snapshot
+def serve_layout():
+    return html.Div([
+        html.H1("Fraud Detection Dashboard", style={'text-align': 'center'}),
+
+        # Summary Boxes
         html.Div([
-            html.H3("Fraud Percentage"),
-            html.P(id="fraud-percentage", children="Loading...")
-        ], style={'width': '30%', 'display': 'inline-block', 'margin': '20px'})
-    ]),
-    
-    # Line Chart for Fraud Trends
-    dcc.Graph(id="fraud-trends"),
-    
-    # Bar Chart for Device and Browser Analysis
-    dcc.Graph(id="device-browser-analysis"),
-    
-    # Geographical Distribution of Fraud Cases
-    dcc.Graph(id="fraud-geolocation"),
-    
-    # Add an interval component to trigger periodic updates
-    dcc.Interval(
-        id="interval-component",
-        interval=60 * 1000,  # Update every 60 seconds
-        n_intervals=0
-    )
-])
+            html.Div([
+                html.H3("Total Transactions"),
+                html.P(id="total-transactions", children="Loading...")
+            ], style={'width': '30%', 'display': 'inline-block', 'margin': '20px'}),
+            html.Div([
+                html.H3("Fraud Cases"),
+                html.P(id="fraud-cases", children="Loading...")
+            ], style={'width': '30%', 'display': 'inline-block', 'margin': '20px'}),
+            html.Div([
+                html.H3("Fraud Percentage"),
+                html.P(id="fraud-percentage", children="Loading...")
+            ], style={'width': '30%', 'display': 'inline-block', 'margin': '20px'})
+        ]),
+
+        # Line Chart for Fraud Trends
+        dcc.Graph(id="fraud-trends"),
+
+        # Bar Chart for Device and Browser Analysis
+        dcc.Graph(id="device-browser-analysis"),
+
+        # Geographical Distribution of Fraud Cases
+        dcc.Graph(id="fraud-geolocation"),
+
+        # Shared client-side cache of the latest aggregates, updated by the SSE stream
+        dcc.Store(id="fraud-data-store", data=fetcher.snapshot),
+        html.Div(id="stream-status", style={'display': 'none'})
+    ])
+
+
+app.layout = serve_layout
+
+# Open one EventSource per browser tab and write pushed snapshots into the store
+app.clientside_callback(
+    """
+    function(_) {
+        if (!window.fraudStatsSource) {
+            window.fraudStatsSource = new EventSource('/stats-stream');
+            window.fraudStatsSource.addEventListener('stats', function(event) {
+                dash_clientside.set_props('fraud-data-store', {data: JSON.parse(event.data)});
+            });
+        }
+        return window.dash_clientside.no_update;
+    }
+    """,
+    Output("stream-status", "children"),
+    Input("stream-status", "id")
+)
 
 # Callbacks for updating dashboard components
 @app.callback(
@@ -61,24 +206,27 @@ app.layout = html.Div([
      Output("fraud-percentage", "children"),
      Output("fraud-trends", "figure"),
      Output("device-browser-analysis", "figure")],
-    [Input("interval-component", "n_intervals")]
+    [Input("fraud-data-store", "data")]
 )
-def update_dashboard(n):
-    stats = fetch_fraud_stats()
+def update_dashboard(data):
+    # No snapshot yet: the first fetch is still running, so keep showing "Loading..."
+    if data is None:
+        return (dash.no_update,) * 5
+    stats = data["stats"]
     if stats:
         # Extract summary stats
         total_transactions = stats["summary"]["total_transactions"]
         fraud_cases = stats["summary"]["fraud_cases"]
         fraud_percentage = f"{stats['summary']['fraud_percentage']:.2f}%"
-        
+
         # Create fraud trends line chart
         fraud_trends = pd.DataFrame(stats["fraud_trends"])
         fig_fraud_trends = px.line(fraud_trends, x="hour_of_day", y="count", title="Fraud Cases Over Time")
-        
+
         # Create device/browser bar chart
         device_browser_fraud = pd.DataFrame(stats["device_browser_fraud"])
         fig_device_browser = px.bar(device_browser_fraud, x="device_id", y="fraud_count", color="browser", title="Fraud Cases by Device and Browser")
-        
+
         return (
             total_transactions,
             fraud_cases,
@@ -93,12 +241,14 @@ def update_dashboard(n):
 # Add a callback for geolocation
 @app.callback(
     Output("fraud-geolocation", "figure"),
-    [Input("interval-component", "n_intervals")]
+    [Input("fraud-data-store", "data")]
 )
-def update_geolocation(n):
-    response = requests.get("http://localhost:5000/fraud-geolocation")
-    if response.status_code == 200:
-        geolocation_data = pd.DataFrame(response.json()["geolocation"])
+def update_geolocation(data):
+    if data is None:
+        return dash.no_update
+    geolocation = data["geolocation"]
+    if geolocation:
+        geolocation_data = pd.DataFrame(geolocation)
         fig_geolocation = px.choropleth(
             geolocation_data,
             locations="country",
@@ -111,4 +261,4 @@ def update_geolocation(n):
         return {}
 
 if __name__ == '__main__':
-    app.run_server(debug=True, port=8050)
\ No newline at end of file
+    app.run_server(debug=True, port=8050)
@@ -0,0 +1,247 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import joblib
+import pandas as pd
+
+DEFAULT_MODEL_PATH = 'models/Random Forest_Fraud_Data.joblib'
+
+# Model used by score_chunk: inherited from the parent under fork, loaded by _init_worker otherwise
+_model = None
+
+
+def read_chunks(path, chunksize, columns=None, skip_chunks=0):
+    """
+    Streams a CSV, Parquet or JSON Lines file as DataFrames of `chunksize`
+    rows (the last one may be shorter). CSV and Parquet inputs only read
+    `columns`. The first `skip_chunks` chunks are skipped without decoding
+    their values, so a resumed run does not re-parse what it already scored.
+    """
+    skip_rows = skip_chunks * chunksize
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns, skiprows=range(1, skip_rows + 1))
+    elif extension == '.parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+
+        # Skip the row groups that end before the first row to read, then the leading rows of the next one
+        first_group, skipped = 0, 0
+        while first_group < parquet_file.num_row_groups and \
+                skipped + parquet_file.metadata.row_group(first_group).num_rows <= skip_rows:
+            skipped += parquet_file.metadata.row_group(first_group).num_rows
+            first_group += 1
+        to_drop = skip_rows - skipped
+
+        # Batches stop at row group boundaries, so regroup them into chunks of exactly `chunksize` rows
+        buffered, buffered_rows = [], 0
+        row_groups = range(first_group, parquet_file.num_row_groups)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns, row_groups=row_groups):
+            if to_drop:
+                dropped = min(to_drop, batch.num_rows)
+                batch = batch.slice(dropped)
+                to_drop -= dropped
+            buffered.append(batch)
+            buffered_rows += batch.num_rows
+            while buffered_rows >= chunksize:
+                table = pa.Table.from_batches(buffered)
+                yield table.slice(0, chunksize).to_pandas()
+                rest = table.slice(chunksize)
+                buffered, buffered_rows = rest.to_batches(), rest.num_rows
+        if buffered_rows:
+            yield pa.Table.from_batches(buffered).to_pandas()
+    elif extension in ('.jsonl', '.json'):
+        with open(path) as f:
+            # Skipped lines are never handed to the JSON parser
+            for _ in itertools.islice(f, skip_rows):
+                pass
+            yield from pd.read_json(f, lines=True, chunksize=chunksize)
+    else:
+        raise ValueError(f"Unsupported input format '{extension}'. Use .csv, .parquet or .jsonl.")
+
+
+def align_columns(chunk, feature_names, id_columns):
+    """
+    Orders the chunk's columns as the model saw them during training and
+    keeps the passthrough id columns in front.
+    """
+    missing = [col for col in list(feature_names) + id_columns if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Missing required features in input data: {missing}")
+    return chunk[id_columns + [col for col in feature_names if col not in id_columns]]
+
+
+def _init_worker(model_path):
+    global _model
+    _model = joblib.load(model_path)
+
+
+def score_chunk(index, chunk, feature_names, id_columns, threshold):
+    probability = _model.predict_proba(chunk[list(feature_names)])[:, 1]
+    scored = chunk[id_columns].copy()
+    scored['probability'] = probability
+    scored['prediction'] = (probability >= threshold).astype(int)
+    return index, scored
+
+
+class Checkpoint:
+    """
+    Tracks how many chunks have been written to the output and the output
+    size at that point, so an interrupted run can truncate any partial
+    write and resume from the last completed chunk. The run's settings are
+    stored too, and a resume with different settings is rejected.
+    """
+
+    # Settings that must match for a resumed run to extend the same output
+    SETTINGS = ["input", "chunksize", "model", "threshold", "id_columns"]
+
+    def __init__(self, path, input_path, chunksize, model_path, threshold, id_columns):
+        self.path = path
+        self.state = {"input": os.path.abspath(input_path), "chunksize": chunksize,
+                      "model": os.path.abspath(model_path), "threshold": threshold, "id_columns": list(id_columns),
+                      "completed_chunks": 0, "rows": 0, "output_bytes": 0}
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            saved = json.load(f)
+        changed = [key for key in self.SETTINGS if saved.get(key) != self.state[key]]
+        if changed:
+            raise ValueError(f"Checkpoint was written with a different {', '.join(changed)}; "
+                             f"rerun without --resume to start over.")
+        self.state = saved
+
+    def save(self, completed_chunks, rows, output_bytes):
+        self.state.update(completed_chunks=completed_chunks, rows=rows, output_bytes=output_bytes)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.state, f)
+        os.replace(temp_path, self.path)
+
+
+def batch_score(input_path, output_path, model_path=DEFAULT_MODEL_PATH, chunksize=100_000,
+                workers=None, threshold=0.5, id_columns=None, resume=False):
+    """
+    Scores `input_path` chunk by chunk across worker processes and appends
+    probabilities and labels to `output_path` (CSV) in input order.
+    """
+    id_columns = list(id_columns or [])
+    workers = workers or os.cpu_count()
+
+    global _model
+    model = joblib.load(model_path)
+    if not hasattr(model, 'feature_names_in_'):
+        raise ValueError("Model does not record feature_names_in_; cannot align input columns.")
+    feature_names = list(model.feature_names_in_)
+
+    # sklearn trees copy their arrays on unpickling, so joblib's mmap_mode cannot share them.
+    # Forked workers instead inherit the parent's model copy-on-write; without fork
+    # (Windows, or when unavailable) every worker loads its own full copy.
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _model = model
+        pool_options = {"mp_context": multiprocessing.get_context('fork')}
+    else:
+        del model
+        pool_options = {"initializer": _init_worker, "initargs": (model_path,)}
+    columns = id_columns + [col for col in feature_names if col not in id_columns]
+
+    checkpoint = Checkpoint(f"{output_path}.checkpoint.json", input_path, chunksize, model_path, threshold, id_columns)
+    if resume:
+        checkpoint.load()
+    else:
+        # A fresh run must not pick up a checkpoint left by an earlier one
+        if os.path.exists(checkpoint.path):
+            os.remove(checkpoint.path)
+    start_chunk = checkpoint.state["completed_chunks"]
+    rows_written = checkpoint.state["rows"]
+    if start_chunk:
+        # Truncating a missing or shorter file would pad it with NUL bytes instead of dropping a partial write
+        output_bytes = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+        if output_bytes < checkpoint.state["output_bytes"]:
+            raise ValueError(f"{output_path} holds {output_bytes} bytes but the checkpoint expects at least "
+                             f"{checkpoint.state['output_bytes']}; rerun without --resume to start over.")
+        print(f"Resuming after chunk {start_chunk - 1} ({rows_written} rows already scored)")
+
+    started = time.perf_counter()
+    rows_this_run = 0
+
+    with open(output_path, 'ab' if start_chunk else 'wb') as output, \
+            ProcessPoolExecutor(max_workers=workers, **pool_options) as executor:
+        # Drop anything written after the last checkpoint
+        output.truncate(checkpoint.state["output_bytes"])
+        output.seek(0, os.SEEK_END)
+
+        pending = {}
+        finished = {}
+        next_chunk = start_chunk
+
+        def write_finished():
+            nonlocal next_chunk, rows_written, rows_this_run
+            while next_chunk in finished:
+                scored = finished.pop(next_chunk)
+                output.write(scored.to_csv(index=False, header=(next_chunk == 0)).encode())
+                output.flush()
+                rows_written += len(scored)
+                rows_this_run += len(scored)
+                next_chunk += 1
+                checkpoint.save(next_chunk, rows_written, output.tell())
+
+                elapsed = time.perf_counter() - started
+                print(f"Chunk {next_chunk - 1} written: {rows_written} rows total, {rows_this_run / elapsed:,.0f} rows/s")
+
+        def collect(block_until_one):
+            if block_until_one:
+                done, _ = wait(list(pending.values()), return_when=FIRST_COMPLETED)
+            else:
+                done = [future for future in pending.values() if future.done()]
+            for future in done:
+                index, scored = future.result()
+                del pending[index]
+                finished[index] = scored
+            write_finished()
+
+        chunks = read_chunks(input_path, chunksize, columns, skip_chunks=start_chunk)
+        for index, chunk in enumerate(chunks, start=start_chunk):
+            aligned = align_columns(chunk, feature_names, id_columns)
+            pending[index] = executor.submit(score_chunk, index, aligned, feature_names, id_columns, threshold)
+
+            collect(block_until_one=False)
+
+            # Bound the chunks held in memory, counting scored chunks still waiting for an earlier one
+            while len(pending) + len(finished) >= 2 * workers:
+                collect(block_until_one=True)
+
+        while pending:
+            collect(block_until_one=True)
+
+    elapsed = time.perf_counter() - started
+    print(f"Scored {rows_this_run} rows in {elapsed:.1f}s ({rows_this_run / elapsed if elapsed else 0:,.0f} rows/s); "
+          f"{rows_written} rows in {output_path}")
+    return rows_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a large transaction file in parallel chunks.")
+    parser.add_argument('input', help="CSV, Parquet or JSON Lines file to score")
+    parser.add_argument('output', help="CSV file the scores are written to")
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help="Path to a joblib model with feature_names_in_")
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--threshold', type=float, default=0.5, help="Probability at or above which a transaction is labelled fraud")
+    parser.add_argument('--id-columns', nargs='*', default=[], help="Input columns copied to the output next to the scores")
+    parser.add_argument('--resume', action='store_true', help="Continue from the last completed chunk of an interrupted run")
+    args = parser.parse_args()
+
+    batch_score(args.input, args.output, model_path=args.model, chunksize=args.chunksize, workers=args.workers,
+                threshold=args.threshold, id_columns=args.id_columns, resume=args.resume)
+
+
+if __name__ == '__main__':
+    main()
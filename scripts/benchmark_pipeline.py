@@ -0,0 +1,190 @@
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+import uuid
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+
+from scripts.generate_synthetic_data import generate_ip_ranges, generate_fraud_data, generate_creditcard
+from scripts.preprocess import handle_missing_values, clean_data, preprocess_fraud_data
+from scripts.preprocess import merge_with_geolocation as preprocess_merge_with_geolocation
+from scripts.merge_datasets import merge_with_geolocation
+from scripts.feature_engineering import engineer_features
+from scripts.data_preparation import prepare_data
+from scripts.model_training import models
+
+
+def peak_memory(fn, *args, **kwargs):
+    """
+    Runs `fn` under tracemalloc and returns the peak bytes it allocated.
+    Only allocations made during the call are traced, so the result does
+    not depend on what earlier stages freed. NumPy and pandas buffers are
+    traced; memory that C extensions take straight from malloc (e.g. inside
+    sklearn's tree builders) is not.
+    """
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True, stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class StageTimer:
+    """
+    Runs pipeline stages, timing each one and recording its peak memory as
+    one result record. Tracing slows every allocation, so with
+    `trace_memory` each stage runs a second time, under tracemalloc, on a
+    deep copy of its inputs (the stages modify their inputs in place).
+    """
+
+    def __init__(self, run_id, quiet=True, trace_memory=True):
+        self.run_id = run_id
+        self.quiet = quiet
+        self.trace_memory = trace_memory
+        self.records = []
+        self.context = {
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count()
+        }
+
+    def run(self, dataset, stage, rows, fn, *args, **kwargs):
+        # Silence the stages' debugging prints so they do not flood the report
+        with contextlib.redirect_stdout(io.StringIO()) if self.quiet else contextlib.nullcontext():
+            traced_args = copy.deepcopy((args, kwargs)) if self.trace_memory else None
+
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            seconds = time.perf_counter() - start
+
+            peak_bytes = peak_memory(fn, *traced_args[0], **traced_args[1]) if self.trace_memory else None
+            del traced_args
+
+        record = {
+            "run_id": self.run_id,
+            "dataset": dataset,
+            "stage": stage,
+            "rows": rows,
+            "seconds": seconds,
+            "rows_per_second": rows / seconds if seconds > 0 else None,
+            "peak_memory_mb": peak_bytes / 2 ** 20 if peak_bytes is not None else None,
+            **self.context
+        }
+        self.records.append(record)
+        memory = f"{record['peak_memory_mb']:>10.1f} MB" if peak_bytes is not None else f"{'-':>10} MB"
+        print(f"{dataset:<12} {stage:<40} {rows:>12,} rows {seconds:>10.3f}s {memory}")
+        return result
+
+
+def _fit_and_score(model, X_train, X_test, y_train):
+    model.fit(X_train, y_train)
+    return model.predict_proba(X_test)
+
+
+def benchmark_fraud_data(timer, rows, ip_ranges, model_names, seed):
+    fraud_data = timer.run('Fraud_Data', 'generate', rows, generate_fraud_data, rows, ip_ranges, seed=seed)
+    ip_address_data = ip_ranges.copy()
+
+    fraud_data = timer.run('Fraud_Data', 'handle_missing_values', rows, handle_missing_values, fraud_data)
+    fraud_data = timer.run('Fraud_Data', 'clean_data', rows, clean_data, fraud_data)
+    ip_address_data = clean_data(ip_address_data)
+    fraud_data = timer.run('Fraud_Data', 'preprocess.merge_with_geolocation', rows, preprocess_merge_with_geolocation, fraud_data, ip_address_data)
+    fraud_data = timer.run('Fraud_Data', 'preprocess_fraud_data', rows, preprocess_fraud_data, fraud_data)
+    merged_data = timer.run('Fraud_Data', 'merge_datasets.merge_with_geolocation', rows, merge_with_geolocation, fraud_data.drop(columns=['country']), ip_address_data)
+    engineered_data = timer.run('Fraud_Data', 'engineer_features', rows, engineer_features, merged_data)
+    X_train, X_test, y_train, y_test = timer.run('Fraud_Data', 'prepare_data', rows, prepare_data, engineered_data, 'class')
+
+    for name in model_names:
+        timer.run('Fraud_Data', f'train: {name}', rows, _fit_and_score, clone(models[name]), X_train, X_test, y_train)
+
+
+def benchmark_creditcard(timer, rows, model_names, seed):
+    creditcard_data = timer.run('creditcard', 'generate', rows, generate_creditcard, rows, seed=seed)
+    creditcard_data = timer.run('creditcard', 'handle_missing_values', rows, handle_missing_values, creditcard_data)
+    creditcard_data = timer.run('creditcard', 'clean_data', rows, clean_data, creditcard_data)
+    X_train, X_test, y_train, y_test = timer.run('creditcard', 'prepare_data', rows, prepare_data, creditcard_data, 'Class')
+
+    for name in model_names:
+        timer.run('creditcard', f'train: {name}', rows, _fit_and_score, clone(models[name]), X_train, X_test, y_train)
+
+
+def load_results(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare_results(baseline, current):
+    """
+    Prints the time and peak-memory ratio of every (dataset, stage, rows)
+    present in both result sets; below 1.0 means the current run is better.
+    The latest record per key wins when a file holds several runs.
+    """
+    def latest(records):
+        return {(r['dataset'], r['stage'], r['rows']): r for r in records}
+
+    baseline, current = latest(baseline), latest(current)
+    print(f"\n{'dataset':<12} {'stage':<40} {'rows':>12} {'time ratio':>11} {'memory ratio':>13}")
+    for key in current:
+        if key not in baseline:
+            continue
+        before, after = baseline[key], current[key]
+        time_ratio = after['seconds'] / before['seconds'] if before['seconds'] else float('nan')
+        memory_ratio = after['peak_memory_mb'] / before['peak_memory_mb'] \
+            if before['peak_memory_mb'] and after['peak_memory_mb'] is not None else float('nan')
+        print(f"{key[0]:<12} {key[1]:<40} {key[2]:>12,} {time_ratio:>11.2f} {memory_ratio:>13.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each pipeline stage on synthetic data and record peak memory.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000], help="Row counts to benchmark")
+    parser.add_argument('--datasets', nargs='+', choices=['Fraud_Data', 'creditcard'], default=['Fraud_Data', 'creditcard'])
+    parser.add_argument('--models', nargs='*', default=['Logistic Regression'], choices=list(models), help="Models to time; none skips training")
+    parser.add_argument('--ip-ranges', type=int, default=138846, help="Rows in the synthetic IpAddress_to_Country table")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='benchmark_results.jsonl', help="JSON Lines file the results are appended to")
+    parser.add_argument('--compare', help="Earlier results file to compare this run against")
+    parser.add_argument('--verbose', action='store_true', help="Show the stages' own output")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc pass and record only timings")
+    args = parser.parse_args()
+
+    timer = StageTimer(run_id=uuid.uuid4().hex[:12], quiet=not args.verbose, trace_memory=not args.no_memory)
+    ip_ranges = generate_ip_ranges(args.ip_ranges, seed=args.seed)
+
+    for rows in args.sizes:
+        if 'Fraud_Data' in args.datasets:
+            benchmark_fraud_data(timer, rows, ip_ranges, args.models, args.seed)
+        if 'creditcard' in args.datasets:
+            benchmark_creditcard(timer, rows, args.models, args.seed)
+
+    with open(args.output, 'a') as f:
+        for record in timer.records:
+            f.write(json.dumps(record) + '\n')
+    print(f"\n{len(timer.records)} results appended to {args.output} (run {timer.run_id})")
+
+    if args.compare:
+        compare_results(load_results(args.compare), timer.records)
+
+
+if __name__ == '__main__':
+    main()
@@ -34,30 +34,31 @@ def prepare_data(df, target_col):
     return X_train, X_test, y_train, y_test
 
 
-# Load datasets
-fraud_data = pd.read_csv('../data/engineered_Fraud_Data.csv')
-creditcard_data = pd.read_csv('../data/cleaned_creditcard.csv')
+if __name__ == '__main__':
+    # Load datasets
+    fraud_data = pd.read_csv('../data/engineered_Fraud_Data.csv')
+    creditcard_data = pd.read_csv('../data/cleaned_creditcard.csv')
 
-# Prepare Fraud_Data
-try:
-    X_train_fraud, X_test_fraud, y_train_fraud, y_test_fraud = prepare_data(fraud_data, 'class')
-except ValueError as e:
-    print(e)
+    # Prepare Fraud_Data
+    try:
+        X_train_fraud, X_test_fraud, y_train_fraud, y_test_fraud = prepare_data(fraud_data, 'class')
+    except ValueError as e:
+        print(e)
 
-# Prepare CreditCard Data
-try:
-    X_train_credit, X_test_credit, y_train_credit, y_test_credit = prepare_data(creditcard_data, 'Class')
-except ValueError as e:
-    print(e)
+    # Prepare CreditCard Data
+    try:
+        X_train_credit, X_test_credit, y_train_credit, y_test_credit = prepare_data(creditcard_data, 'Class')
+    except ValueError as e:
+        print(e)
 
-# Save prepared datasets for Fraud_Data
-X_train_fraud.to_csv('../data/X_train_fraud.csv', index=False)
-X_test_fraud.to_csv('../data/X_test_fraud.csv', index=False)
-y_train_fraud.to_csv('../data/y_train_fraud.csv', index=False, header=False)
-y_test_fraud.to_csv('../data/y_test_fraud.csv', index=False, header=False)
+    # Save prepared datasets for Fraud_Data
+    X_train_fraud.to_csv('../data/X_train_fraud.csv', index=False)
+    X_test_fraud.to_csv('../data/X_test_fraud.csv', index=False)
+    y_train_fraud.to_csv('../data/y_train_fraud.csv', index=False, header=False)
+    y_test_fraud.to_csv('../data/y_test_fraud.csv', index=False, header=False)
 
-# Save prepared datasets for CreditCard Data
-X_train_credit.to_csv('../data/X_train_credit.csv', index=False)
-X_test_credit.to_csv('../data/X_test_credit.csv', index=False)
-y_train_credit.to_csv('../data/y_train_credit.csv', index=False, header=False)
-y_test_credit.to_csv('../data/y_test_credit.csv', index=False, header=False)
\ No newline at end of file
+    # Save prepared datasets for CreditCard Data
+    X_train_credit.to_csv('../data/X_train_credit.csv', index=False)
+    X_test_credit.to_csv('../data/X_test_credit.csv', index=False)
+    y_train_credit.to_csv('../data/y_train_credit.csv', index=False, header=False)
+    y_test_credit.to_csv('../data/y_test_credit.csv', index=False, header=False)
\ No newline at end of file
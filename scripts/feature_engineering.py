@@ -30,15 +30,16 @@ def engineer_features(df):
     return df
 
 
-# Load merged dataset
-merged_data = pd.read_csv('../data/merged_Fraud_Data_with_Geolocation.csv')
+if __name__ == '__main__':
+    # Load merged dataset
+    merged_data = pd.read_csv('../data/merged_Fraud_Data_with_Geolocation.csv')
 
-# Engineer features
-engineered_data = engineer_features(merged_data)
+    # Engineer features
+    engineered_data = engineer_features(merged_data)
 
-# Debugging: Print the shape and first few rows of the engineered dataset
-print("Engineered Data Shape:", engineered_data.shape)
-print(engineered_data.head())
+    # Debugging: Print the shape and first few rows of the engineered dataset
+    print("Engineered Data Shape:", engineered_data.shape)
+    print(engineered_data.head())
 
-# Save engineered dataset
-engineered_data.to_csv('../data/engineered_Fraud_Data.csv', index=False)
\ No newline at end of file
+    # Save engineered dataset
+    engineered_data.to_csv('../data/engineered_Fraud_Data.csv', index=False)
\ No newline at end of file
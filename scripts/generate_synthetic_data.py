@@ -0,0 +1,179 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+# Category distributions observed in the original Fraud_Data.csv
+SOURCES = ['SEO', 'Ads', 'Direct']
+SOURCE_WEIGHTS = [0.40, 0.40, 0.20]
+BROWSERS = ['Chrome', 'IE', 'Safari', 'FireFox', 'Opera']
+BROWSER_WEIGHTS = [0.41, 0.24, 0.16, 0.16, 0.03]
+
+# Class balance of the original datasets
+FRAUD_RATE = 0.0936
+CREDITCARD_FRAUD_RATE = 0.00172
+
+IPV4_SPACE = 2 ** 32
+SIGNUP_START = pd.Timestamp('2015-01-01').value // 10 ** 9
+SIGNUP_SPAN = 230 * 24 * 3600  # Signups span roughly January to mid-August 2015
+
+
+def _country_names(n_countries):
+    """
+    Returns placeholder country names; the first few match real names so
+    the dashboard choropleth still resolves them.
+    """
+    known = ['United States', 'China', 'Japan', 'United Kingdom', 'Korea Republic of',
+             'Germany', 'France', 'Canada', 'Brazil', 'Italy']
+    return known[:n_countries] + [f'Country {i}' for i in range(len(known), n_countries)]
+
+
+def generate_ip_ranges(n_ranges=138846, n_countries=235, gap_fill=0.7, seed=42):
+    """
+    Generates IpAddress_to_Country records: sorted, non-overlapping IPv4
+    ranges with countries drawn from a Zipf-like distribution so a few
+    countries own most ranges. Random cut points split the address space
+    into ranges and gaps; each range then grows over `gap_fill` of the gap
+    after it, leaving roughly 85% of the space mapped by default.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Cut the address space into 2 * n_ranges sorted points: (lower, upper) pairs with gaps between them
+    points = np.sort(rng.choice(IPV4_SPACE, size=2 * n_ranges, replace=False))
+    lower = points[0::2]
+    upper = points[1::2]
+
+    # Grow each range over part of the gap that follows it
+    gaps = np.append(lower[1:], IPV4_SPACE) - upper - 1
+    upper = upper + (gaps * gap_fill).astype(np.int64)
+
+    weights = 1.0 / np.arange(1, n_countries + 1)
+    countries = np.array(_country_names(n_countries))[rng.choice(n_countries, size=n_ranges, p=weights / weights.sum())]
+
+    return pd.DataFrame({
+        'lower_bound_ip_address': lower.astype(np.float64),
+        'upper_bound_ip_address': upper.astype(np.int64),
+        'country': countries
+    })
+
+
+def _device_ids(rng, n):
+    """
+    Random 13-character uppercase device identifiers.
+    """
+    letters = rng.integers(ord('A'), ord('Z') + 1, size=(n, 13), dtype=np.uint8)
+    return letters.view('S13').ravel().astype(str)
+
+
+def generate_fraud_data(n_rows, ip_ranges, fraud_rate=FRAUD_RATE, start_user_id=0, seed=42):
+    """
+    Generates Fraud_Data records with the original schema. Fraudulent
+    transactions reuse a small pool of devices and often purchase within
+    seconds of signing up, as in the real data.
+    """
+    rng = np.random.default_rng(seed)
+    is_fraud = rng.random(n_rows) < fraud_rate
+
+    signup = SIGNUP_START + rng.integers(0, SIGNUP_SPAN, size=n_rows)
+    delay = rng.exponential(50 * 24 * 3600, size=n_rows).astype(np.int64)
+    instant = is_fraud & (rng.random(n_rows) < 0.5)
+    delay[instant] = 1
+    purchase = signup + delay
+
+    device_id = _device_ids(rng, n_rows)
+    fraud_rows = np.flatnonzero(is_fraud)
+    if len(fraud_rows):
+        ring_devices = _device_ids(rng, max(1, len(fraud_rows) // 10))
+        device_id[fraud_rows] = ring_devices[rng.integers(0, len(ring_devices), size=len(fraud_rows))]
+
+    # Draw IPs inside a random range, leaving ~15% in unmapped gaps
+    all_lower = ip_ranges['lower_bound_ip_address'].to_numpy(dtype=np.int64)
+    all_upper = ip_ranges['upper_bound_ip_address'].to_numpy(dtype=np.int64)
+    ranges = rng.integers(0, len(ip_ranges), size=n_rows)
+    lower = all_lower[ranges]
+    upper = all_upper[ranges]
+
+    # Unmapped IPs fall in the gap between the chosen range and the next one
+    unmapped = rng.random(n_rows) < 0.15
+    next_lower = np.append(all_lower[1:], IPV4_SPACE)[ranges]
+    lower = np.where(unmapped, upper + 1, lower)
+    upper = np.where(unmapped, next_lower - 1, upper)
+    ip_address = lower + (rng.random(n_rows) * np.maximum(upper - lower + 1, 1)).astype(np.int64)
+
+    return pd.DataFrame({
+        'user_id': np.arange(start_user_id, start_user_id + n_rows),
+        'signup_time': pd.to_datetime(signup, unit='s').astype(str),
+        'purchase_time': pd.to_datetime(purchase, unit='s').astype(str),
+        'purchase_value': np.clip(rng.lognormal(3.4, 0.5, size=n_rows), 9, 154).astype(np.int64),
+        'device_id': device_id,
+        'source': rng.choice(SOURCES, size=n_rows, p=SOURCE_WEIGHTS),
+        'browser': rng.choice(BROWSERS, size=n_rows, p=BROWSER_WEIGHTS),
+        'sex': rng.choice(['M', 'F'], size=n_rows, p=[0.58, 0.42]),
+        'age': np.clip(rng.normal(33, 8.6, size=n_rows), 18, 76).astype(np.int64),
+        'ip_address': ip_address.astype(np.float64),
+        'class': is_fraud.astype(np.int64)
+    })
+
+
+def generate_creditcard(n_rows, fraud_rate=CREDITCARD_FRAUD_RATE, seed=42):
+    """
+    Generates creditcard records: Time, PCA components V1-V28, Amount and
+    Class. Fraudulent rows are shifted along a few components so they are
+    separable, as in the original data.
+    """
+    rng = np.random.default_rng(seed)
+    is_fraud = rng.random(n_rows) < fraud_rate
+
+    components = rng.standard_normal((n_rows, 28))
+    shift = np.zeros(28)
+    shift[[2, 9, 11, 13, 16]] = [-4.0, -3.0, -4.5, -5.0, -3.5]
+    components[is_fraud] += shift
+
+    data = {'Time': np.sort(rng.integers(0, 172792, size=n_rows)).astype(np.float64)}
+    data.update({f'V{i + 1}': components[:, i] for i in range(28)})
+    data['Amount'] = np.round(rng.lognormal(3.0, 1.5, size=n_rows), 2)
+    data['Class'] = is_fraud.astype(np.int64)
+    return pd.DataFrame(data)
+
+
+def write_dataset(path, n_rows, make_chunk, chunk_size=1_000_000, seed=42):
+    """
+    Writes `n_rows` records to a CSV file one chunk at a time, so any size
+    up to hundreds of millions of rows fits in memory. `make_chunk(n, offset,
+    seed)` returns the DataFrame for rows [offset, offset + n).
+    """
+    for i, offset in enumerate(range(0, n_rows, chunk_size)):
+        chunk = make_chunk(min(chunk_size, n_rows - offset), offset, seed + i)
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+        print(f"{os.path.basename(path)}: {offset + len(chunk)}/{n_rows} rows written")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Fraud_Data, IpAddress_to_Country and creditcard datasets.")
+    parser.add_argument('--rows', type=int, default=10_000, help="Rows per transaction dataset")
+    parser.add_argument('--ip-ranges', type=int, default=138846, help="Rows in IpAddress_to_Country")
+    parser.add_argument('--output-dir', default='../data/synthetic')
+    parser.add_argument('--chunk-size', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    ip_ranges = generate_ip_ranges(args.ip_ranges, seed=args.seed)
+    ip_ranges.to_csv(os.path.join(args.output_dir, 'IpAddress_to_Country.csv'), index=False)
+
+    write_dataset(
+        os.path.join(args.output_dir, 'Fraud_Data.csv'), args.rows,
+        lambda n, offset, seed: generate_fraud_data(n, ip_ranges, start_user_id=offset, seed=seed),
+        chunk_size=args.chunk_size, seed=args.seed
+    )
+    write_dataset(
+        os.path.join(args.output_dir, 'creditcard.csv'), args.rows,
+        lambda n, offset, seed: generate_creditcard(n, seed=seed),
+        chunk_size=args.chunk_size, seed=args.seed
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -36,20 +36,21 @@ def merge_with_geolocation(fraud_data, ip_address_data):
     return fraud_data
 
 
-# Load datasets
-fraud_data = pd.read_csv('../data/cleaned_Fraud_Data.csv')
-ip_address_data = pd.read_csv('../data/cleaned_IpAddress_to_Country.csv')
+if __name__ == '__main__':
+    # Load datasets
+    fraud_data = pd.read_csv('../data/cleaned_Fraud_Data.csv')
+    ip_address_data = pd.read_csv('../data/cleaned_IpAddress_to_Country.csv')
 
-# Ensure ip_address_data columns are numeric
-ip_address_data['lower_bound_ip_address'] = pd.to_numeric(ip_address_data['lower_bound_ip_address'], errors='coerce').astype('Int64', errors='ignore')
-ip_address_data['upper_bound_ip_address'] = pd.to_numeric(ip_address_data['upper_bound_ip_address'], errors='coerce').astype('Int64', errors='ignore')
+    # Ensure ip_address_data columns are numeric
+    ip_address_data['lower_bound_ip_address'] = pd.to_numeric(ip_address_data['lower_bound_ip_address'], errors='coerce').astype('Int64', errors='ignore')
+    ip_address_data['upper_bound_ip_address'] = pd.to_numeric(ip_address_data['upper_bound_ip_address'], errors='coerce').astype('Int64', errors='ignore')
 
-# Merge datasets
-merged_data = merge_with_geolocation(fraud_data, ip_address_data)
+    # Merge datasets
+    merged_data = merge_with_geolocation(fraud_data, ip_address_data)
 
-# Debugging: Print the first few rows of the merged dataset
-print("Merged Data:")
-print(merged_data[['ip_address', 'country']].head())
+    # Debugging: Print the first few rows of the merged dataset
+    print("Merged Data:")
+    print(merged_data[['ip_address', 'country']].head())
 
-# Save merged dataset
-merged_data.to_csv('../data/merged_Fraud_Data_with_Geolocation.csv', index=False)
\ No newline at end of file
+    # Save merged dataset
+    merged_data.to_csv('../data/merged_Fraud_Data_with_Geolocation.csv', index=False)
\ No newline at end of file
@@ -11,29 +11,6 @@ import pandas as pd
 # Set the tracking URI programmatically
 mlflow.set_tracking_uri('http://localhost:5000')
 
-# Load prepared datasets for Fraud_Data
-X_train_fraud = pd.read_csv('../data/X_train_fraud.csv')
-X_test_fraud = pd.read_csv('../data/X_test_fraud.csv')
-y_train_fraud = pd.read_csv('../data/y_train_fraud.csv', header=None).squeeze()  # Squeeze to convert to Series
-y_test_fraud = pd.read_csv('../data/y_test_fraud.csv', header=None).squeeze()   # Squeeze to convert to Series
-
-# Load prepared datasets for CreditCard Data
-X_train_credit = pd.read_csv('../data/X_train_credit.csv')
-X_test_credit = pd.read_csv('../data/X_test_credit.csv')
-y_train_credit = pd.read_csv('../data/y_train_credit.csv', header=None).squeeze()  # Squeeze to convert to Series
-y_test_credit = pd.read_csv('../data/y_test_credit.csv', header=None).squeeze()   # Squeeze to convert to Series
-
-# Debugging: Print shapes of datasets
-print("Shapes of datasets after loading:")
-print(f"X_train_fraud shape: {X_train_fraud.shape}, y_train_fraud shape: {y_train_fraud.shape}")
-print(f"X_test_fraud shape: {X_test_fraud.shape}, y_test_fraud shape: {y_test_fraud.shape}")
-
-# Ensure consistent shapes between features and labels
-if X_train_fraud.shape[0] != y_train_fraud.shape[0]:
-    raise ValueError("Mismatch in number of samples between X_train_fraud and y_train_fraud.")
-if X_test_fraud.shape[0] != y_test_fraud.shape[0]:
-    raise ValueError("Mismatch in number of samples between X_test_fraud and y_test_fraud.")
-
 # Define models
 models = {
     "Logistic Regression": LogisticRegression(),
@@ -85,8 +62,32 @@ def train_and_evaluate(X_train, X_test, y_train, y_test, dataset_name):
             print(f"Error during training {model_name}: {e}")
 
 
-# Train models for Fraud_Data
-train_and_evaluate(X_train_fraud, X_test_fraud, y_train_fraud, y_test_fraud, 'Fraud_Data')
+if __name__ == '__main__':
+    # Load prepared datasets for Fraud_Data
+    X_train_fraud = pd.read_csv('../data/X_train_fraud.csv')
+    X_test_fraud = pd.read_csv('../data/X_test_fraud.csv')
+    y_train_fraud = pd.read_csv('../data/y_train_fraud.csv', header=None).squeeze()  # Squeeze to convert to Series
+    y_test_fraud = pd.read_csv('../data/y_test_fraud.csv', header=None).squeeze()   # Squeeze to convert to Series
+
+    # Load prepared datasets for CreditCard Data
+    X_train_credit = pd.read_csv('../data/X_train_credit.csv')
+    X_test_credit = pd.read_csv('../data/X_test_credit.csv')
+    y_train_credit = pd.read_csv('../data/y_train_credit.csv', header=None).squeeze()  # Squeeze to convert to Series
+    y_test_credit = pd.read_csv('../data/y_test_credit.csv', header=None).squeeze()   # Squeeze to convert to Series
+
+    # Debugging: Print shapes of datasets
+    print("Shapes of datasets after loading:")
+    print(f"X_train_fraud shape: {X_train_fraud.shape}, y_train_fraud shape: {y_train_fraud.shape}")
+    print(f"X_test_fraud shape: {X_test_fraud.shape}, y_test_fraud shape: {y_test_fraud.shape}")
+
+    # Ensure consistent shapes between features and labels
+    if X_train_fraud.shape[0] != y_train_fraud.shape[0]:
+        raise ValueError("Mismatch in number of samples between X_train_fraud and y_train_fraud.")
+    if X_test_fraud.shape[0] != y_test_fraud.shape[0]:
+        raise ValueError("Mismatch in number of samples between X_test_fraud and y_test_fraud.")
+
+    # Train models for Fraud_Data
+    train_and_evaluate(X_train_fraud, X_test_fraud, y_train_fraud, y_test_fraud, 'Fraud_Data')
 
-# Train models for CreditCard Data (if available)
-train_and_evaluate(X_train_credit, X_test_credit, y_train_credit, y_test_credit, 'CreditCard_Data')
\ No newline at end of file
+    # Train models for CreditCard Data (if available)
+    train_and_evaluate(X_train_credit, X_test_credit, y_train_credit, y_test_credit, 'CreditCard_Data')
\ No newline at end of file
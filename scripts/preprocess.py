@@ -80,32 +80,33 @@ def merge_with_geolocation(fraud_data, ip_address_data):
     return fraud_data
 
 
-# Load datasets
-fraud_data = pd.read_csv('../data/Fraud_Data.csv')
-ip_address_data = pd.read_csv('../data/IpAddress_to_Country.csv')
-creditcard_data = pd.read_csv('../data/creditcard.csv')
+if __name__ == '__main__':
+    # Load datasets
+    fraud_data = pd.read_csv('../data/Fraud_Data.csv')
+    ip_address_data = pd.read_csv('../data/IpAddress_to_Country.csv')
+    creditcard_data = pd.read_csv('../data/creditcard.csv')
 
-# Handle missing values
-fraud_data = handle_missing_values(fraud_data)
-ip_address_data = handle_missing_values(ip_address_data)
-creditcard_data = handle_missing_values(creditcard_data)
+    # Handle missing values
+    fraud_data = handle_missing_values(fraud_data)
+    ip_address_data = handle_missing_values(ip_address_data)
+    creditcard_data = handle_missing_values(creditcard_data)
 
-# Clean datasets
-fraud_data = clean_data(fraud_data)
-ip_address_data = clean_data(ip_address_data)
-creditcard_data = clean_data(creditcard_data)
+    # Clean datasets
+    fraud_data = clean_data(fraud_data)
+    ip_address_data = clean_data(ip_address_data)
+    creditcard_data = clean_data(creditcard_data)
 
-# Merge fraud_data with geolocation data
-fraud_data = merge_with_geolocation(fraud_data, ip_address_data)
+    # Merge fraud_data with geolocation data
+    fraud_data = merge_with_geolocation(fraud_data, ip_address_data)
 
-# Preprocess Fraud_Data.csv
-fraud_data = preprocess_fraud_data(fraud_data)
+    # Preprocess Fraud_Data.csv
+    fraud_data = preprocess_fraud_data(fraud_data)
 
-# Verify the new features
-print("Preprocessed Fraud Data with Country:")
-print(fraud_data[['hour_of_day', 'day_of_week', 'time_since_signup', 'country']].head())
+    # Verify the new features
+    print("Preprocessed Fraud Data with Country:")
+    print(fraud_data[['hour_of_day', 'day_of_week', 'time_since_signup', 'country']].head())
 
-# Save cleaned datasets
-fraud_data.to_csv('../data/cleaned_Fraud_Data.csv', index=False)
-ip_address_data.to_csv('../data/cleaned_IpAddress_to_Country.csv', index=False)
-creditcard_data.to_csv('../data/cleaned_creditcard.csv', index=False)
\ No newline at end of file
+    # Save cleaned datasets
+    fraud_data.to_csv('../data/cleaned_Fraud_Data.csv', index=False)
+    ip_address_data.to_csv('../data/cleaned_IpAddress_to_Country.csv', index=False)
+    creditcard_data.to_csv('../data/cleaned_creditcard.csv', index=False)
\ No newline at end of file
@@ -4,6 +4,9 @@ import joblib
 import pandas as pd
 import logging
 import numpy as np
+from src.fraud_cube import FraudCube, CUBE_DIMENSIONS, INTEGER_DIMENSIONS
+from src.drift_monitor import DriftMonitor
+import os
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +21,27 @@ app = Flask(__name__)
 FRAUD_DATA_PATH = 'data/cleaned_Fraud_Data.csv'
 fraud_data = pd.read_csv(FRAUD_DATA_PATH)
 
+# Default and maximum number of groups returned per high-cardinality breakdown
+DEFAULT_TOP_K = 20
+MAX_TOP_K = 1000
+MAX_BINS = 200
+
+# Fraud counts per (device_id, browser) only change with the dataset, so aggregate them once
+fraud_transactions = fraud_data[fraud_data['class'] == 1]
+device_browser_counts = fraud_transactions.groupby(['device_id', 'browser']).size()
+fraud_trend_counts = fraud_transactions.groupby('hour_of_day').size()
+
+# Pre-aggregate counts and purchase_value sums so sliced stats never rescan the dataset
+try:
+    fraud_cube = FraudCube.from_dataframe(fraud_data)
+    # The cube skips rows missing a dimension, so sliced breakdowns must skip them too
+    cube_fraud_transactions = fraud_transactions.dropna(subset=fraud_cube.dimensions)
+    logging.info(f"Fraud cube built with shape {fraud_cube.shape}")
+except Exception as e:
+    logging.error(f"Failed to build fraud cube: {str(e)}")
+    fraud_cube = None
+    cube_fraud_transactions = None
+
 # Load the trained model
 MODEL_PATH = 'models/Random Forest_Fraud_Data.joblib'
 try:
@@ -27,6 +51,99 @@ except Exception as e:
     logging.error(f"Failed to load model: {str(e)}")
     model = None  # Set model to None if loading fails
 
+# Drift baseline: feature bins from the training set, score bins from held-out scores
+DRIFT_BASELINE_PATH = 'models/drift_baseline.json'
+TRAIN_DATA_PATH = 'data/X_train_fraud.csv'
+TEST_DATA_PATH = 'data/X_test_fraud.csv'
+
+def build_drift_monitor():
+    """
+    Loads the cached drift baseline, rebuilding it when it is missing or was
+    built for different features than the loaded model expects. The score
+    baseline uses held-out rows: in-sample scores of a tree ensemble pile up
+    near 0 and 1 and would make every live score look drifted.
+    """
+    if model is None:
+        raise ValueError("Model not loaded; cannot build the drift baseline.")
+    feature_names = list(model.feature_names_in_)
+
+    if os.path.exists(DRIFT_BASELINE_PATH):
+        monitor = DriftMonitor.load(DRIFT_BASELINE_PATH)
+        if monitor.feature_names == feature_names:
+            return monitor
+        logging.info("Drift baseline does not match the model's features; rebuilding it.")
+
+    X_train = pd.read_csv(TRAIN_DATA_PATH)[feature_names]
+    X_test = pd.read_csv(TEST_DATA_PATH)[feature_names]
+    monitor = DriftMonitor.from_training_data(X_train, model.predict_proba(X_test)[:, 1])
+    monitor.save(DRIFT_BASELINE_PATH)
+    return monitor
+
+try:
+    drift_monitor = build_drift_monitor()
+    logging.info(f"Drift monitor ready for {len(drift_monitor.feature_names)} features")
+except Exception as e:
+    logging.error(f"Failed to set up drift monitor: {str(e)}")
+    drift_monitor = None
+
+def conditional_json(payload):
+    """
+    Wraps a JSON payload in a response carrying an ETag, answering with
+    304 Not Modified when the client's If-None-Match already matches.
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+def parse_cube_filters():
+    """
+    Reads slice filters from the query string, one comma-separated list per
+    cube dimension, e.g. ?country=Japan,China&hour_of_day=0,1,2
+    """
+    filters = {}
+    for dim in CUBE_DIMENSIONS:
+        values = [value for arg in request.args.getlist(dim) for value in arg.split(',') if value != '']
+        if values:
+            filters[dim] = [int(value) for value in values] if dim in INTEGER_DIMENSIONS else values
+    return filters
+
+def filtered_device_browser_counts(filters):
+    """
+    Fraud counts per (device_id, browser) within the slice selected by
+    `filters`. device_id is not a cube dimension, so slices fall back to the
+    fraud transactions the cube counted.
+    """
+    if not filters:
+        return device_browser_counts
+    mask = np.ones(len(cube_fraud_transactions), dtype=bool)
+    for dim, values in filters.items():
+        mask &= cube_fraud_transactions[dim].isin(values).to_numpy()
+    # No need to sort the group keys: top_k_groups ranks them and breaks ties by position
+    return cube_fraud_transactions[mask].groupby(['device_id', 'browser'], sort=False).size()
+
+def top_k_groups(counts, k):
+    """
+    Returns the positions of the k largest groups in `counts`, largest first.
+    Only those k candidates are sorted; the rest are split off with a
+    linear-time partition. Ties are broken by group position so that pages
+    taken from the ranking never overlap.
+    """
+    values = counts.to_numpy()
+    k = min(k, len(values))
+    if k == 0:
+        return np.array([], dtype=int)
+
+    if k < len(values):
+        # Value of the k-th largest group, found without a full sort
+        kth = np.partition(values, len(values) - k)[len(values) - k]
+        above = np.flatnonzero(values > kth)
+        ties = np.flatnonzero(values == kth)[:k - len(above)]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(len(values))
+
+    return candidates[np.lexsort((candidates, -values[candidates]))]
+
 @app.route('/predict', methods=['POST'])
 def predict():
     try:
@@ -47,6 +164,13 @@ def predict():
         prediction = model.predict(features)
         probability = model.predict_proba(features)[:, 1]
         
+        # Feed the drift monitor; monitoring must never fail a prediction
+        if drift_monitor is not None:
+            try:
+                drift_monitor.update(data, float(probability[0]))
+            except Exception as e:
+                logging.error(f"Error updating drift monitor: {str(e)}")
+
         # Log the request and prediction
         logging.info(f"Request: {data}, Prediction: {prediction[0]}, Probability: {probability[0]}")
         
@@ -64,6 +188,17 @@ def predict():
         logging.error(f"Error during prediction: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/drift', methods=['GET'])
+def drift():
+    try:
+        if drift_monitor is None:
+            raise ValueError("Drift monitor not available. Please ensure the baseline or training data exists.")
+        return jsonify(drift_monitor.report())
+
+    except Exception as e:
+        logging.error(f"Error fetching drift report: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/health', methods=['GET'])
 def health():
     logging.info("Health check successful.")
@@ -76,15 +211,24 @@ def fraud_geolocation():
         # Check if 'country' column exists
         if 'country' not in fraud_data.columns:
             raise ValueError("Column 'country' is missing in the fraud dataset.")
-        
-        # Group by country for fraud analysis
-        fraud_geolocation = fraud_data[fraud_data['class'] == 1].groupby('country').size().reset_index(name='fraud_count')
-        
-        # Convert NumPy types to Python types
-        fraud_geolocation['fraud_count'] = fraud_geolocation['fraud_count'].astype(int).tolist()
-        
-        return jsonify({
-            "geolocation": fraud_geolocation.to_dict(orient='records')
+        if fraud_cube is None:
+            raise ValueError("Fraud cube is not available.")
+
+        try:
+            filters = parse_cube_filters()
+        except ValueError as ve:
+            logging.error(f"Invalid filters in fraud geolocation request: {str(ve)}")
+            return jsonify({"error": str(ve)}), 400
+
+        # Roll the cube up to country for fraud analysis
+        fraud_geolocation = [
+            {"country": row["country"], "fraud_count": row["fraud_count"]}
+            for row in fraud_cube.query(filters, group_by=['country'])
+            if row["fraud_count"] > 0
+        ]
+
+        return conditional_json({
+            "geolocation": fraud_geolocation
         })
 
     except Exception as e:
@@ -98,36 +242,115 @@ def fraud_stats():
         # Check if 'country' column exists
         if 'country' not in fraud_data.columns:
             raise ValueError("Column 'country' is missing in the fraud dataset.")
-        
-        # Calculate summary statistics
-        total_transactions = int(len(fraud_data))
-        fraud_cases = int(fraud_data['class'].sum())
+
+        # Parse breakdown options: page size, page offset, "Other" bucketing and histogram bins
+        top_k = request.args.get('top_k', DEFAULT_TOP_K, type=int)
+        offset = request.args.get('offset', 0, type=int)
+        include_other = request.args.get('other', 'true').lower() not in ('false', '0', 'no')
+        bins = request.args.get('bins', 0, type=int)
+        if not 0 <= top_k <= MAX_TOP_K or offset < 0 or not 0 <= bins <= MAX_BINS:
+            logging.error("Invalid breakdown parameters in fraud stats request.")
+            return jsonify({"error": f"top_k must be between 0 and {MAX_TOP_K}, bins between 0 and {MAX_BINS}, and offset non-negative"}), 400
+        if fraud_cube is None:
+            raise ValueError("Fraud cube is not available.")
+
+        try:
+            filters = parse_cube_filters()
+        except ValueError as ve:
+            logging.error(f"Invalid filters in fraud stats request: {str(ve)}")
+            return jsonify({"error": str(ve)}), 400
+
+        if filters:
+            # Calculate summary statistics and hourly fraud trends from the cube slice
+            totals = fraud_cube.query(filters)[0]
+            total_transactions = totals['total_count']
+            fraud_cases = totals['fraud_count']
+            fraud_trends = [
+                {"hour_of_day": row["hour_of_day"], "count": row["fraud_count"]}
+                for row in sorted(fraud_cube.query(filters, group_by=['hour_of_day']), key=lambda row: row["hour_of_day"])
+                if row["fraud_count"] > 0
+            ]
+        else:
+            # Unfiltered stats cover every row, including those the cube skips for a missing dimension
+            total_transactions = int(len(fraud_data))
+            fraud_cases = int(fraud_data['class'].sum())
+            fraud_trends = [{"hour_of_day": hour, "count": count}
+                            for hour, count in zip(fraud_trend_counts.index.tolist(), fraud_trend_counts.tolist())]
         non_fraud_cases = total_transactions - fraud_cases
-        fraud_percentage = float((fraud_cases / total_transactions) * 100)
-        
-        # Group by hour_of_day for fraud trends
-        fraud_trends = fraud_data[fraud_data['class'] == 1].groupby('hour_of_day').size().reset_index(name='count')
-        fraud_trends['count'] = fraud_trends['count'].astype(int).tolist()
-        
-        # Group by device_id and browser for fraud distribution
-        device_browser_fraud = fraud_data[fraud_data['class'] == 1].groupby(['device_id', 'browser']).size().reset_index(name='fraud_count')
+        fraud_percentage = float((fraud_cases / total_transactions) * 100) if total_transactions else 0.0
+
+        # Keep only the requested page of the device_id/browser fraud distribution
+        breakdown_counts = filtered_device_browser_counts(filters)
+        ranked = top_k_groups(breakdown_counts, offset + top_k)
+        device_browser_fraud = breakdown_counts.iloc[ranked[offset:]].reset_index(name='fraud_count')
         device_browser_fraud['fraud_count'] = device_browser_fraud['fraud_count'].astype(int).tolist()
-        
-        return jsonify({
+        device_browser_fraud = device_browser_fraud.to_dict(orient='records')
+
+        # Fold every group ranked after this page into a single "Other" bucket
+        other_count = int(breakdown_counts.sum()) - int(breakdown_counts.iloc[ranked].sum())
+        if include_other and other_count > 0:
+            device_browser_fraud.append({"device_id": "Other", "browser": "Other", "fraud_count": other_count})
+
+        response = {
             "summary": {
                 "total_transactions": total_transactions,
                 "fraud_cases": fraud_cases,
                 "non_fraud_cases": non_fraud_cases,
                 "fraud_percentage": fraud_percentage
             },
-            "fraud_trends": fraud_trends.to_dict(orient='records'),
-            "device_browser_fraud": device_browser_fraud.to_dict(orient='records')
-        })
+            "fraud_trends": fraud_trends,
+            "device_browser_fraud": device_browser_fraud,
+            "device_browser_pagination": {
+                "offset": offset,
+                "top_k": top_k,
+                "total_groups": int(len(breakdown_counts)),
+                "other_count": other_count
+            }
+        }
+
+        # Bin the per-group fraud counts server-side instead of shipping every group
+        if bins > 0:
+            hist, edges = np.histogram(breakdown_counts.to_numpy(), bins=bins)
+            response["device_browser_histogram"] = [
+                {"bin_start": float(edges[i]), "bin_end": float(edges[i + 1]), "groups": int(hist[i])}
+                for i in range(len(hist))
+            ]
+
+        return conditional_json(response)
 
     except Exception as e:
         logging.error(f"Error fetching fraud stats: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/fraud-stats/cube', methods=['GET'])
+def fraud_stats_cube():
+    """
+    Answers arbitrary slices and roll-ups of the fraud cube, e.g.
+    ?group_by=country,source&day_of_week=5,6
+    """
+    try:
+        if fraud_cube is None:
+            raise ValueError("Fraud cube is not available.")
+
+        group_by = [dim for dim in request.args.get('group_by', '').split(',') if dim != '']
+        try:
+            filters = parse_cube_filters()
+            cells = fraud_cube.query(filters, group_by=group_by)
+        except ValueError as ve:
+            logging.error(f"Invalid fraud cube query: {str(ve)}")
+            return jsonify({"error": str(ve)}), 400
+
+        return conditional_json({
+            "group_by": group_by,
+            "filters": filters,
+            "cells": cells
+        })
+
+    except Exception as e:
+        logging.error(f"Error querying fraud cube: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
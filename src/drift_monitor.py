@@ -0,0 +1,221 @@
+import json
+import threading
+import time
+
+import numpy as np
+
+# Name under which the predicted fraud probability is tracked next to the features
+SCORE_COLUMN = 'score'
+
+# Conventional PSI level above which a distribution is considered to have drifted
+PSI_ALERT = 0.2
+
+# Predictions needed in the window before a column can be flagged as drifted
+MIN_WINDOW_SIZE = 200
+
+# Floor applied to bin proportions so empty bins do not make PSI infinite
+EPSILON = 1e-4
+
+
+def psi(expected, actual):
+    """
+    Population Stability Index between two binned distributions.
+    """
+    expected = np.maximum(expected, EPSILON)
+    actual = np.maximum(actual, EPSILON)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks(expected, actual):
+    """
+    Kolmogorov-Smirnov statistic computed on the binned CDFs.
+    """
+    return float(np.max(np.abs(np.cumsum(expected) - np.cumsum(actual))))
+
+
+class DriftMonitor:
+    """
+    Constant-memory monitor of feature and score drift over live predictions.
+
+    Every tracked column is binned on cut points fixed from the training
+    baseline. Counts live in a ring of `window_slots` histograms of
+    `slot_size` updates each, so the sliding window spans the most recent
+    window_slots * slot_size predictions and memory never grows. Missing and
+    non-finite values are left out of the histograms, in the baseline and
+    live alike, and counted separately. Histograms built on the same cut
+    points can be merged by adding their counts.
+    """
+
+    def __init__(self, columns, cut_points, baseline, window_slots=10, slot_size=1000, min_window_size=MIN_WINDOW_SIZE):
+        # The score is always the last tracked column
+        self.columns = list(columns)
+        if self.columns[-1] != SCORE_COLUMN:
+            raise ValueError(f"The last tracked column must be '{SCORE_COLUMN}'.")
+        self.window_slots = window_slots
+        self.slot_size = slot_size
+        self.min_window_size = min_window_size
+
+        # Pad every column's cut points with +inf so binning is one vectorized comparison
+        width = max(len(cuts) for cuts in cut_points)
+        self.cut_points = np.full((len(self.columns), width), np.inf)
+        for i, cuts in enumerate(cut_points):
+            self.cut_points[i, :len(cuts)] = cuts
+        self.n_bins = np.array([len(cuts) + 1 for cuts in cut_points])
+
+        self.baseline = np.zeros((len(self.columns), width + 1))
+        for i, proportions in enumerate(baseline):
+            self.baseline[i, :len(proportions)] = proportions
+
+        self.counts = np.zeros((window_slots, len(self.columns), width + 1), dtype=np.int64)
+        self.missing = np.zeros((window_slots, len(self.columns)), dtype=np.int64)
+        self._rows = np.arange(len(self.columns))
+        self._slot = 0
+        self._slot_fills = np.zeros(window_slots, dtype=np.int64)
+        self._lock = threading.Lock()
+        self.updates = 0
+        self.update_ns = 0
+
+    @property
+    def feature_names(self):
+        return self.columns[:-1]
+
+    @classmethod
+    def from_training_data(cls, X, scores, n_bins=10, score_bins=20, **kwargs):
+        """
+        Builds the baseline from the training features (quantile cut points)
+        and the model's scores (equal-width cut points on [0, 1]). `scores`
+        should come from held-out rows, not from the rows the model was fit on.
+        Missing and non-finite values are left out, as they are live.
+        """
+        columns, cut_points, baseline = [], [], []
+        for col in X.columns:
+            values = X[col].to_numpy(dtype=np.float64)
+            values = values[np.isfinite(values)]
+            cuts = np.unique(np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1]))
+            columns.append(col)
+            cut_points.append(cuts)
+            baseline.append(np.bincount(np.searchsorted(cuts, values, side='right'), minlength=len(cuts) + 1) / len(values))
+
+        cuts = np.linspace(0, 1, score_bins + 1)[1:-1]
+        scores = np.asarray(scores, dtype=np.float64)
+        scores = scores[np.isfinite(scores)]
+        columns.append(SCORE_COLUMN)
+        cut_points.append(cuts)
+        baseline.append(np.bincount(np.searchsorted(cuts, scores, side='right'), minlength=len(cuts) + 1) / len(scores))
+
+        return cls(columns, cut_points, baseline, **kwargs)
+
+    def to_dict(self):
+        return {
+            "columns": self.columns,
+            "cut_points": [self.cut_points[i, :n - 1].tolist() for i, n in enumerate(self.n_bins)],
+            "baseline": [self.baseline[i, :n].tolist() for i, n in enumerate(self.n_bins)],
+            "window_slots": self.window_slots,
+            "slot_size": self.slot_size,
+            "min_window_size": self.min_window_size
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state["columns"], [np.array(cuts) for cuts in state["cut_points"]], state["baseline"],
+                   window_slots=state["window_slots"], slot_size=state["slot_size"],
+                   min_window_size=state.get("min_window_size", MIN_WINDOW_SIZE))
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def update(self, features, score):
+        """
+        Records one prediction. `features` maps feature names to values;
+        missing (None, NaN) or infinite values are counted as missing for
+        their column instead of being binned.
+        """
+        start = time.perf_counter_ns()
+        values = np.empty(len(self.columns))
+        values[:-1] = [features.get(col, np.nan) for col in self.columns[:-1]]
+        values[-1] = score
+        observed = np.isfinite(values)
+        bins = (values[:, None] >= self.cut_points).sum(axis=1)
+
+        with self._lock:
+            self.counts[self._slot, self._rows[observed], bins[observed]] += 1
+            self.missing[self._slot] += ~observed
+            self._slot_fills[self._slot] += 1
+            if self._slot_fills[self._slot] >= self.slot_size:
+                # Rotate: the oldest slot is cleared and reused for new predictions
+                self._slot = (self._slot + 1) % self.window_slots
+                self.counts[self._slot] = 0
+                self.missing[self._slot] = 0
+                self._slot_fills[self._slot] = 0
+            self.updates += 1
+            self.update_ns += time.perf_counter_ns() - start
+
+    def merge(self, other):
+        """
+        Adds another monitor's window into this one, e.g. to combine the
+        monitors of several server workers. Both must share cut points and
+        window_slots. Slots are added by age, so the other monitor's history
+        ages out slot by slot as it would have, and slot_size becomes the sum
+        of both so the merged window stays within window_capacity.
+        """
+        if self.columns != other.columns or not np.array_equal(self.cut_points, other.cut_points):
+            raise ValueError("Cannot merge drift monitors built on different baselines.")
+        if self.window_slots != other.window_slots:
+            raise ValueError("Cannot merge drift monitors with different window_slots.")
+
+        # Slot indices ordered from the newest (current) slot to the oldest
+        ages = np.arange(self.window_slots)
+        with other._lock:
+            other_slots = (other._slot - ages) % other.window_slots
+            counts = other.counts[other_slots]
+            missing = other.missing[other_slots]
+            fills = other._slot_fills[other_slots]
+            updates, update_ns, slot_size = other.updates, other.update_ns, other.slot_size
+
+        with self._lock:
+            slots = (self._slot - ages) % self.window_slots
+            self.counts[slots] += counts
+            self.missing[slots] += missing
+            self._slot_fills[slots] += fills
+            self.slot_size += slot_size
+            self.updates += updates
+            self.update_ns += update_ns
+
+    def report(self):
+        """
+        PSI and KS of every tracked column over the current window against
+        the training baseline, over the values each column actually observed.
+        `drifted` stays None until a column has `min_window_size` observed
+        values in the window, since PSI on a handful of rows is noise.
+        """
+        with self._lock:
+            window = self.counts.sum(axis=0)
+            missing = self.missing.sum(axis=0)
+            window_size = int(self._slot_fills.sum())
+            updates, update_ns = self.updates, self.update_ns
+
+        columns = {}
+        for i, col in enumerate(self.columns):
+            n = self.n_bins[i]
+            observed = int(window[i, :n].sum())
+            expected = self.baseline[i, :n]
+            actual = window[i, :n] / observed if observed else expected
+            column_psi = psi(expected, actual)
+            columns[col] = {"psi": column_psi, "ks": ks(expected, actual), "missing": int(missing[i]),
+                            "drifted": column_psi > PSI_ALERT if observed >= self.min_window_size else None}
+
+        return {
+            "window_size": window_size,
+            "window_capacity": self.window_slots * self.slot_size,
+            "min_window_size": self.min_window_size,
+            "features": {col: columns[col] for col in self.feature_names},
+            "score": columns[SCORE_COLUMN],
+            "updates": updates,
+            "mean_update_us": update_ns / updates / 1000 if updates else None
+        }
@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+# Dimensions of the cube, in axis order
+CUBE_DIMENSIONS = ['hour_of_day', 'day_of_week', 'country', 'source', 'browser']
+
+# Dimensions whose labels are integers (query-string values need converting)
+INTEGER_DIMENSIONS = ['hour_of_day', 'day_of_week']
+
+# Measures stored for every cell
+CUBE_MEASURES = ['fraud_count', 'total_count', 'purchase_value_sum']
+
+
+class FraudCube:
+    """
+    Dense pre-aggregated cube of fraud counts, transaction counts and
+    purchase_value sums over hour_of_day x day_of_week x country x source x
+    browser. Rows are folded in incrementally with `update`, and `query`
+    answers any slice or roll-up from the cube without touching raw rows.
+    """
+
+    def __init__(self, dimensions=None):
+        self.dimensions = list(dimensions or CUBE_DIMENSIONS)
+
+        # Per-dimension code <-> label lookups; labels are appended as they are first seen
+        self.labels = {dim: [] for dim in self.dimensions}
+        self._codes = {dim: {} for dim in self.dimensions}
+
+        shape = (0,) * len(self.dimensions)
+        self.fraud_count = np.zeros(shape, dtype=np.int64)
+        self.total_count = np.zeros(shape, dtype=np.int64)
+        self.purchase_value_sum = np.zeros(shape, dtype=np.float64)
+
+    @classmethod
+    def from_dataframe(cls, df, dimensions=None):
+        cube = cls(dimensions)
+        cube.update(df)
+        return cube
+
+    @classmethod
+    def from_csv(cls, path, chunksize=100_000, dimensions=None):
+        """
+        Builds the cube chunk by chunk so the cleaned dataset never has to
+        fit in memory at once.
+        """
+        cube = cls(dimensions)
+        columns = cube.dimensions + ['class', 'purchase_value']
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+            cube.update(chunk)
+        return cube
+
+    @property
+    def shape(self):
+        return self.total_count.shape
+
+    def _encode(self, dim, values):
+        """
+        Maps a column to integer codes, registering unseen labels.
+        """
+        local_codes, uniques = pd.factorize(values)
+        lookup = self._codes[dim]
+        for label in uniques.tolist():
+            if label not in lookup:
+                lookup[label] = len(self.labels[dim])
+                self.labels[dim].append(label)
+        mapping = np.array([lookup[label] for label in uniques.tolist()], dtype=np.int64)
+        return mapping[local_codes]
+
+    def _grow(self):
+        """
+        Pads every measure array so each axis covers all registered labels.
+        """
+        target = tuple(len(self.labels[dim]) for dim in self.dimensions)
+        if target == self.shape:
+            return
+        padding = [(0, new - old) for old, new in zip(self.shape, target)]
+        self.fraud_count = np.pad(self.fraud_count, padding)
+        self.total_count = np.pad(self.total_count, padding)
+        self.purchase_value_sum = np.pad(self.purchase_value_sum, padding)
+
+    def update(self, df):
+        """
+        Adds the rows of `df` to the cube. `df` needs every cube dimension
+        plus 'class' and 'purchase_value'; rows missing a dimension are skipped.
+        """
+        missing = [col for col in self.dimensions + ['class', 'purchase_value'] if col not in df.columns]
+        if missing:
+            raise ValueError(f"Columns {missing} are missing in the fraud dataset.")
+
+        df = df.dropna(subset=self.dimensions)
+        if df.empty:
+            return
+
+        codes = [self._encode(dim, df[dim]) for dim in self.dimensions]
+        self._grow()
+
+        # Scatter every row into its cell with one bincount per measure
+        flat = np.ravel_multi_index(codes, self.shape)
+        size = self.total_count.size
+        fraud = df['class'].to_numpy(dtype=np.float64, na_value=0)
+        purchase_value = df['purchase_value'].to_numpy(dtype=np.float64, na_value=0)
+
+        self.total_count += np.bincount(flat, minlength=size).reshape(self.shape)
+        self.fraud_count += np.bincount(flat, weights=fraud, minlength=size).astype(np.int64).reshape(self.shape)
+        self.purchase_value_sum += np.bincount(flat, weights=purchase_value, minlength=size).reshape(self.shape)
+
+    def query(self, filters=None, group_by=None):
+        """
+        Returns the measures for the slice selected by `filters` (a mapping of
+        dimension -> allowed labels), rolled up to the `group_by` dimensions.
+        Each record holds the group labels plus every measure; cells without
+        transactions are left out.
+        """
+        filters = filters or {}
+        group_by = list(group_by or [])
+        unknown = [dim for dim in list(filters) + group_by if dim not in self.dimensions]
+        if unknown:
+            raise ValueError(f"Unknown cube dimensions: {unknown}")
+        if len(set(group_by)) != len(group_by):
+            raise ValueError(f"Repeated dimensions in group_by: {group_by}")
+
+        # Restrict each filtered axis to the codes of the requested labels
+        measures = [self.fraud_count, self.total_count, self.purchase_value_sum]
+        axis_codes = {}
+        for dim, values in filters.items():
+            axis = self.dimensions.index(dim)
+            lookup = self._codes[dim]
+            codes = np.array(sorted({lookup[v] for v in values if v in lookup}), dtype=np.int64)
+            axis_codes[dim] = codes
+            measures = [np.take(m, codes, axis=axis) for m in measures]
+
+        # Roll up every axis that is not grouped on
+        rolled_axes = tuple(i for i, dim in enumerate(self.dimensions) if dim not in group_by)
+        measures = [m.sum(axis=rolled_axes) for m in measures]
+
+        # Reorder the remaining axes to follow group_by
+        kept = [dim for dim in self.dimensions if dim in group_by]
+        order = [kept.index(dim) for dim in group_by]
+        measures = [np.transpose(m, order) for m in measures]
+
+        fraud_count, total_count, purchase_value_sum = measures
+        group_labels = []
+        for dim in group_by:
+            codes = axis_codes.get(dim, np.arange(len(self.labels[dim])))
+            group_labels.append([self.labels[dim][c] for c in codes])
+
+        records = []
+        for index in zip(*np.nonzero(total_count)) if group_by else [()]:
+            record = {dim: group_labels[i][index[i]] for i, dim in enumerate(group_by)}
+            record['fraud_count'] = int(fraud_count[index])
+            record['total_count'] = int(total_count[index])
+            record['purchase_value_sum'] = float(purchase_value_sum[index])
+            records.append(record)
+        return records
@@ -0,0 +1,73 @@
+import importlib
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def make_cleaned_fraud_data(n_rows=3000, seed=0):
+    """
+    Small stand-in for data/cleaned_Fraud_Data.csv. Devices come from a
+    small pool so that many (device_id, browser) groups tie on fraud count.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'user_id': np.arange(n_rows),
+        'purchase_value': rng.integers(9, 150, n_rows),
+        'device_id': [f'D{i:03d}' for i in rng.integers(0, 300, n_rows)],
+        'source': rng.choice(['SEO', 'Ads', 'Direct'], n_rows),
+        'browser': rng.choice(['Chrome', 'IE', 'Safari', 'FireFox', 'Opera'], n_rows),
+        'sex': rng.choice(['M', 'F'], n_rows),
+        'age': rng.integers(18, 70, n_rows),
+        'ip_address': rng.integers(0, 2 ** 32, n_rows).astype(float),
+        'class': (rng.random(n_rows) < 0.2).astype(int),
+        'country': rng.choice(['United States', 'China', 'Japan', 'Unknown'], n_rows),
+        'hour_of_day': rng.integers(0, 24, n_rows),
+        'day_of_week': rng.integers(0, 7, n_rows),
+        'time_since_signup': rng.random(n_rows) * 1e6
+    })
+
+
+def _import_serve_model(workdir, fraud_data):
+    """
+    Imports serve_model.py from a scratch directory holding `fraud_data` as
+    the cleaned dataset; no model file is present, so only the stats
+    endpoints work.
+    """
+    (workdir / 'data').mkdir()
+    fraud_data.to_csv(workdir / 'data' / 'cleaned_Fraud_Data.csv', index=False)
+
+    previous = os.getcwd()
+    os.chdir(workdir)
+    try:
+        sys.modules.pop('serve_model', None)
+        return importlib.import_module('serve_model')
+    finally:
+        os.chdir(previous)
+
+
+@pytest.fixture(scope='session')
+def import_serve_model():
+    return _import_serve_model
+
+
+@pytest.fixture(scope='session')
+def make_fraud_data():
+    return make_cleaned_fraud_data
+
+
+@pytest.fixture(scope='session')
+def fraud_data():
+    return make_cleaned_fraud_data()
+
+
+@pytest.fixture(scope='session')
+def serve_model(tmp_path_factory, fraud_data):
+    return _import_serve_model(tmp_path_factory.mktemp('serve_model'), fraud_data)
+
+
+@pytest.fixture
+def client(serve_model):
+    return serve_model.app.test_client()
@@ -0,0 +1,191 @@
+import json
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+import scripts.batch_score as batch_score_module
+from scripts.batch_score import batch_score, read_chunks, Checkpoint
+
+FEATURES = ['purchase_value', 'age', 'time_since_signup']
+CHUNKSIZE = 70
+
+
+@pytest.fixture(scope='module')
+def transactions():
+    rng = np.random.default_rng(0)
+    n_rows = 1000
+    return pd.DataFrame({
+        'user_id': np.arange(n_rows),
+        'purchase_value': rng.integers(9, 150, n_rows),
+        'age': rng.integers(18, 70, n_rows),
+        'time_since_signup': rng.random(n_rows) * 1e6
+    })
+
+
+@pytest.fixture(scope='module')
+def model_path(tmp_path_factory, transactions):
+    labels = (transactions['time_since_signup'] < 2e5).astype(int)
+    model = RandomForestClassifier(n_estimators=10, max_depth=4, random_state=0)
+    model.fit(transactions[FEATURES], labels)
+    path = tmp_path_factory.mktemp('model') / 'model.joblib'
+    joblib.dump(model, path)
+    return str(path)
+
+
+@pytest.fixture(scope='module')
+def inputs(tmp_path_factory, transactions):
+    """
+    The same transactions as CSV, JSON Lines and Parquet. The Parquet row
+    groups do not line up with the chunk size.
+    """
+    directory = tmp_path_factory.mktemp('inputs')
+    paths = {extension: str(directory / f'transactions.{extension}') for extension in ['csv', 'jsonl', 'parquet']}
+    transactions.to_csv(paths['csv'], index=False)
+    transactions.to_json(paths['jsonl'], orient='records', lines=True)
+    transactions.to_parquet(paths['parquet'], index=False, row_group_size=110)
+    return paths
+
+
+def score(input_path, output_path, model_path, **kwargs):
+    options = dict(chunksize=CHUNKSIZE, workers=2, id_columns=['user_id'])
+    options.update(kwargs)
+    return batch_score(str(input_path), str(output_path), model_path=model_path, **options)
+
+
+def expected_scores(transactions, model_path, threshold=0.5):
+    probability = joblib.load(model_path).predict_proba(transactions[FEATURES])[:, 1]
+    return pd.DataFrame({
+        'user_id': transactions['user_id'],
+        'probability': probability,
+        'prediction': (probability >= threshold).astype(int)
+    })
+
+
+@pytest.mark.parametrize('extension', ['csv', 'jsonl', 'parquet'])
+@pytest.mark.parametrize('skip_chunks', [0, 3, 14, 20])
+def test_read_chunks_have_fixed_size_and_skip_exactly(inputs, transactions, extension, skip_chunks):
+    chunks = list(read_chunks(inputs[extension], CHUNKSIZE, ['user_id'] + FEATURES, skip_chunks=skip_chunks))
+    assert all(len(chunk) == CHUNKSIZE for chunk in chunks[:-1])
+
+    read = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=transactions.columns)
+    expected = transactions.iloc[skip_chunks * CHUNKSIZE:].reset_index(drop=True)
+    assert read['user_id'].tolist() == expected['user_id'].tolist()
+
+
+def test_output_matches_direct_predictions_in_order(tmp_path, inputs, transactions, model_path):
+    rows = score(inputs['csv'], tmp_path / 'scores.csv', model_path, workers=3)
+    assert rows == len(transactions)
+
+    output = pd.read_csv(tmp_path / 'scores.csv')
+    expected = expected_scores(transactions, model_path)
+    pd.testing.assert_frame_equal(output, expected, check_exact=False)
+
+
+def test_input_formats_give_identical_output(tmp_path, inputs, model_path):
+    outputs = {}
+    for extension, path in inputs.items():
+        score(path, tmp_path / f'{extension}.csv', model_path)
+        outputs[extension] = (tmp_path / f'{extension}.csv').read_bytes()
+    assert outputs['csv'] == outputs['jsonl'] == outputs['parquet']
+
+
+def test_chunks_in_memory_are_bounded(tmp_path, inputs, model_path, monkeypatch):
+    read, in_memory = [0], []
+    original_read_chunks, original_save = batch_score_module.read_chunks, Checkpoint.save
+
+    def counting_read_chunks(*args, **kwargs):
+        for chunk in original_read_chunks(*args, **kwargs):
+            read[0] += 1
+            yield chunk
+
+    def recording_save(self, completed_chunks, rows, output_bytes):
+        in_memory.append(read[0] - completed_chunks)
+        original_save(self, completed_chunks, rows, output_bytes)
+
+    monkeypatch.setattr(batch_score_module, 'read_chunks', counting_read_chunks)
+    monkeypatch.setattr(Checkpoint, 'save', recording_save)
+    score(inputs['csv'], tmp_path / 'scores.csv', model_path, chunksize=10, workers=2)
+
+    assert len(in_memory) == 100
+    assert max(in_memory) <= 2 * 2
+
+
+@pytest.mark.parametrize('extension', ['csv', 'jsonl', 'parquet'])
+def test_resume_after_partial_write_is_byte_identical(tmp_path, inputs, model_path, monkeypatch, extension):
+    reference = tmp_path / 'reference.csv'
+    score(inputs[extension], reference, model_path)
+
+    # Interrupt the run once five chunks are checkpointed, then leave half a chunk behind
+    original_save = Checkpoint.save
+
+    def interrupting_save(self, completed_chunks, rows, output_bytes):
+        original_save(self, completed_chunks, rows, output_bytes)
+        if completed_chunks == 5:
+            raise KeyboardInterrupt
+
+    output = tmp_path / 'scores.csv'
+    monkeypatch.setattr(Checkpoint, 'save', interrupting_save)
+    with pytest.raises(KeyboardInterrupt):
+        score(inputs[extension], output, model_path)
+    monkeypatch.setattr(Checkpoint, 'save', original_save)
+    with open(output, 'ab') as f:
+        f.write(b'123,0.5')
+
+    score(inputs[extension], output, model_path, resume=True)
+    assert output.read_bytes() == reference.read_bytes()
+
+
+def write_checkpoint(output, inputs, model_path, **overrides):
+    checkpoint = Checkpoint(f'{output}.checkpoint.json', inputs['csv'], CHUNKSIZE, model_path, 0.5, ['user_id'])
+    checkpoint.state.update(overrides)
+    checkpoint.save(3, 3 * CHUNKSIZE, 4000)
+
+
+@pytest.mark.parametrize('existing', [None, b'user_id,probability,prediction\n'])
+def test_resume_rejects_missing_or_short_output(tmp_path, inputs, model_path, existing):
+    output = tmp_path / 'scores.csv'
+    if existing is not None:
+        output.write_bytes(existing)
+    write_checkpoint(output, inputs, model_path)
+
+    with pytest.raises(ValueError, match='bytes but the checkpoint expects'):
+        score(inputs['csv'], output, model_path, resume=True)
+    assert not output.exists() or output.read_bytes() == existing
+
+
+@pytest.mark.parametrize('change', [
+    {'threshold': 0.7},
+    {'id_columns': ['user_id', 'age']},
+    {'chunksize': CHUNKSIZE + 1}
+])
+def test_resume_rejects_different_settings(tmp_path, inputs, model_path, change):
+    output = tmp_path / 'scores.csv'
+    output.write_bytes(b'x' * 5000)
+    write_checkpoint(output, inputs, model_path)
+
+    with pytest.raises(ValueError, match=next(iter(change))):
+        score(inputs['csv'], output, model_path, resume=True, **change)
+
+
+def test_resume_rejects_different_model_or_input(tmp_path, inputs, model_path):
+    output = tmp_path / 'scores.csv'
+    output.write_bytes(b'x' * 5000)
+    write_checkpoint(output, inputs, model_path, model='/elsewhere/model.joblib')
+    with pytest.raises(ValueError, match='model'):
+        score(inputs['csv'], output, model_path, resume=True)
+
+    write_checkpoint(output, inputs, model_path)
+    with pytest.raises(ValueError, match='input'):
+        score(inputs['jsonl'], output, model_path, resume=True)
+
+
+def test_fresh_run_discards_old_checkpoint(tmp_path, inputs, transactions, model_path):
+    output = tmp_path / 'scores.csv'
+    write_checkpoint(output, inputs, model_path, threshold=0.9)
+    score(inputs['csv'], output, model_path)
+
+    assert len(pd.read_csv(output)) == len(transactions)
+    assert json.loads((tmp_path / 'scores.csv.checkpoint.json').read_text())['threshold'] == 0.5
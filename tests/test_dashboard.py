@@ -0,0 +1,150 @@
+import threading
+
+import dash
+import pytest
+import requests
+
+import dashboard
+from dashboard import FraudStatsFetcher
+
+STATS = {
+    'summary': {'total_transactions': 10, 'fraud_cases': 2, 'fraud_percentage': 20.0},
+    'fraud_trends': [{'hour_of_day': 0, 'count': 2}],
+    'device_browser_fraud': [{'device_id': 'D001', 'browser': 'IE', 'fraud_count': 2}]
+}
+GEOLOCATION = {'geolocation': [{'country': 'Japan', 'fraud_count': 2}]}
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, etag=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = {'ETag': etag} if etag else {}
+
+    def json(self):
+        if isinstance(self._payload, Exception):
+            raise self._payload
+        return self._payload
+
+
+class FakeBackend:
+    """
+    Stands in for session.get: answers 304 when the client sends the
+    current ETag, otherwise whatever `responses` holds for the path.
+    """
+
+    def __init__(self):
+        self.responses = {
+            '/fraud-stats': FakeResponse(200, STATS, etag='"stats-1"'),
+            '/fraud-geolocation': FakeResponse(200, GEOLOCATION, etag='"geo-1"')
+        }
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        path = url[len('http://backend'):]
+        self.requests.append((path, dict(headers or {})))
+        response = self.responses[path]
+        if isinstance(response, Exception):
+            raise response
+        if headers and headers.get('If-None-Match') == response.headers.get('ETag'):
+            return FakeResponse(304)
+        return response
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+@pytest.fixture
+def fetcher(backend):
+    fetcher = FraudStatsFetcher('http://backend')
+    fetcher.session.get = backend.get
+    return fetcher
+
+
+def test_first_refresh_publishes_snapshot(fetcher):
+    fetcher.refresh()
+    assert fetcher.version == 1
+    assert fetcher.snapshot == {'stats': STATS, 'geolocation': GEOLOCATION['geolocation']}
+
+
+def test_not_modified_reuses_payload_without_version_bump(fetcher, backend):
+    fetcher.refresh()
+    snapshot = fetcher.snapshot
+    fetcher.refresh()
+
+    assert fetcher.version == 1
+    assert fetcher.snapshot is snapshot
+    assert backend.requests[-2:] == [('/fraud-stats', {'If-None-Match': '"stats-1"'}),
+                                     ('/fraud-geolocation', {'If-None-Match': '"geo-1"'})]
+
+
+def test_changed_payload_bumps_version(fetcher, backend):
+    fetcher.refresh()
+    changed = dict(STATS, summary=dict(STATS['summary'], fraud_cases=3))
+    backend.responses['/fraud-stats'] = FakeResponse(200, changed, etag='"stats-2"')
+    fetcher.refresh()
+
+    assert fetcher.version == 2
+    assert fetcher.snapshot['stats'] == changed
+
+
+@pytest.mark.parametrize('failure', [
+    requests.ConnectionError('backend down'),
+    FakeResponse(500),
+    FakeResponse(200, ValueError('invalid JSON'), etag='"stats-2"')
+])
+def test_failed_fetch_keeps_last_snapshot(fetcher, backend, failure):
+    fetcher.refresh()
+    snapshot = fetcher.snapshot
+    backend.responses['/fraud-stats'] = failure
+    backend.responses['/fraud-geolocation'] = failure
+    fetcher.refresh()
+
+    assert fetcher.version == 1
+    assert fetcher.snapshot is snapshot
+
+
+def test_failed_first_fetch_leaves_no_snapshot(fetcher, backend):
+    backend.responses['/fraud-stats'] = requests.ConnectionError('backend down')
+    backend.responses['/fraud-geolocation'] = requests.ConnectionError('backend down')
+    fetcher.refresh()
+    assert fetcher.version == 0
+    assert fetcher.snapshot is None
+
+
+def test_wait_for_update_times_out_on_same_version(fetcher):
+    fetcher.refresh()
+    assert fetcher.wait_for_update(1, timeout=0.01) == (1, fetcher.snapshot)
+
+
+def test_wait_for_update_returns_immediately_when_behind(fetcher):
+    fetcher.refresh()
+    assert fetcher.wait_for_update(0, timeout=5) == (1, fetcher.snapshot)
+
+
+def test_wait_for_update_wakes_on_refresh(fetcher):
+    result = {}
+    waiter = threading.Thread(target=lambda: result.update(value=fetcher.wait_for_update(0, timeout=5)))
+    waiter.start()
+    fetcher.refresh()
+    waiter.join(timeout=5)
+
+    assert not waiter.is_alive()
+    assert result['value'] == (1, fetcher.snapshot)
+
+
+def test_callbacks_keep_loading_until_first_snapshot():
+    assert dashboard.update_dashboard(None) == (dash.no_update,) * 5
+    assert dashboard.update_geolocation(None) is dash.no_update
+
+
+def test_callbacks_show_error_when_fetch_failed():
+    assert dashboard.update_dashboard({'stats': None, 'geolocation': None}) == ('Error', 'Error', 'Error', {}, {})
+    assert dashboard.update_geolocation({'stats': None, 'geolocation': None}) == {}
+
+
+def test_callbacks_render_snapshot():
+    total, fraud, percentage, _, _ = dashboard.update_dashboard({'stats': STATS, 'geolocation': None})
+    assert (total, fraud, percentage) == (10, 2, '20.00%')
@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.drift_monitor import DriftMonitor, PSI_ALERT
+
+
+def make_baseline_data(n_rows=20000, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        'purchase_value': rng.normal(40, 15, n_rows),
+        'age': rng.integers(18, 70, n_rows).astype(float),
+        'time_since_signup': rng.exponential(1e5, n_rows)
+    })
+    return X, rng.beta(1, 8, n_rows)
+
+
+def make_monitor(**kwargs):
+    X, scores = make_baseline_data()
+    return DriftMonitor.from_training_data(X, scores, **kwargs)
+
+
+def feed(monitor, X, scores):
+    for row, score in zip(X.to_dict('records'), scores):
+        monitor.update(row, score)
+
+
+def test_window_turns_over_after_capacity():
+    monitor = make_monitor(window_slots=4, slot_size=50, min_window_size=10)
+    X, scores = make_baseline_data(n_rows=4 * 50, seed=1)
+    feed(monitor, X.iloc[:3 * 50], scores[:3 * 50])
+    assert monitor.report()['window_size'] == 3 * 50
+
+    # Filling the last slot rotates back onto the oldest one and clears it
+    feed(monitor, X.iloc[3 * 50:], scores[3 * 50:])
+    report = monitor.report()
+    assert report['window_size'] == 3 * 50
+    assert report['window_capacity'] == 4 * 50
+    assert report['updates'] == 4 * 50
+
+    feed(monitor, X.iloc[:500], scores[:500])
+    assert monitor.report()['window_size'] <= 4 * 50
+
+
+def test_psi_and_ks_near_zero_on_baseline_samples():
+    monitor = make_monitor()
+    X, scores = make_baseline_data(n_rows=5000, seed=1)
+    feed(monitor, X, scores)
+
+    report = monitor.report()
+    for column in list(report['features'].values()) + [report['score']]:
+        assert column['psi'] < 0.02
+        assert column['ks'] < 0.05
+        assert column['drifted'] is False
+
+
+def test_shifted_stream_is_flagged():
+    monitor = make_monitor()
+    X, scores = make_baseline_data(n_rows=2000, seed=1)
+    X['purchase_value'] += 30
+    feed(monitor, X, scores)
+
+    report = monitor.report()
+    assert report['features']['purchase_value']['psi'] > PSI_ALERT
+    assert report['features']['purchase_value']['drifted'] is True
+    assert report['features']['age']['drifted'] is False
+
+
+def test_drifted_is_none_below_min_window():
+    monitor = make_monitor(min_window_size=100)
+    X, scores = make_baseline_data(n_rows=99, seed=1)
+    X['purchase_value'] += 30
+    feed(monitor, X, scores)
+
+    report = monitor.report()
+    assert report['window_size'] == 99
+    assert all(column['drifted'] is None for column in report['features'].values())
+    assert report['score']['drifted'] is None
+
+
+def test_round_trip_preserves_baseline():
+    monitor = make_monitor(window_slots=3, slot_size=20, min_window_size=5)
+    restored = DriftMonitor.from_dict(monitor.to_dict())
+
+    assert restored.columns == monitor.columns
+    assert np.array_equal(restored.cut_points, monitor.cut_points)
+    assert np.array_equal(restored.baseline, monitor.baseline)
+    assert (restored.window_slots, restored.slot_size, restored.min_window_size) == (3, 20, 5)
+
+    X, scores = make_baseline_data(n_rows=40, seed=1)
+    feed(monitor, X, scores)
+    feed(restored, X, scores)
+    expected, actual = monitor.report(), restored.report()
+    for report in (expected, actual):
+        report.pop('mean_update_us')
+    assert actual == expected
+
+
+def test_save_and_load(tmp_path):
+    monitor = make_monitor()
+    monitor.save(tmp_path / 'baseline.json')
+    assert DriftMonitor.load(tmp_path / 'baseline.json').to_dict() == monitor.to_dict()
+
+
+def test_missing_and_infinite_values_are_not_drift():
+    X, scores = make_baseline_data()
+    X.loc[X.index[::3], 'age'] = np.nan
+    monitor = DriftMonitor.from_training_data(X, scores)
+
+    live, live_scores = make_baseline_data(n_rows=3000, seed=1)
+    live = live.astype(object)
+    live.loc[live.index[::3], 'age'] = None
+    live.loc[live.index[1::50], 'purchase_value'] = np.inf
+    live.loc[live.index[2::50], 'time_since_signup'] = -np.inf
+    feed(monitor, live, live_scores)
+
+    report = monitor.report()
+    assert report['window_size'] == 3000
+    assert report['features']['age']['missing'] == 1000
+    assert report['features']['purchase_value']['missing'] == 60
+    assert report['features']['time_since_signup']['missing'] == 60
+    assert report['score']['missing'] == 0
+    for column in report['features'].values():
+        assert column['psi'] < 0.02
+        assert column['drifted'] is False
+
+
+def test_a_few_infinite_values_do_not_flag_drift():
+    monitor = make_monitor()
+    X, scores = make_baseline_data(n_rows=1000, seed=1)
+    feed(monitor, X, scores)
+    for _ in range(10):
+        monitor.update({'purchase_value': np.inf, 'age': 30.0, 'time_since_signup': 1e5}, 0.1)
+
+    report = monitor.report()
+    assert report['window_size'] == 1010
+    assert report['features']['purchase_value']['psi'] < 0.02
+
+
+def test_min_window_counts_observed_values_only():
+    monitor = make_monitor(min_window_size=100)
+    X, scores = make_baseline_data(n_rows=500, seed=1)
+    X['age'] = np.nan
+    feed(monitor, X, scores)
+
+    report = monitor.report()
+    assert report['features']['age']['drifted'] is None
+    assert report['features']['purchase_value']['drifted'] is False
+
+
+def test_merge_adds_windows():
+    first, second = make_monitor(), make_monitor()
+    X, scores = make_baseline_data(n_rows=300, seed=1)
+    feed(first, X.iloc[:100], scores[:100])
+    feed(second, X.iloc[100:], scores[100:])
+
+    first.merge(second)
+    report = first.report()
+    assert report['window_size'] == 300
+    assert report['window_size'] <= report['window_capacity']
+    assert first.updates == 300
+
+
+def test_merged_full_windows_stay_within_capacity():
+    first = make_monitor(window_slots=4, slot_size=50)
+    second = make_monitor(window_slots=4, slot_size=50)
+    X, scores = make_baseline_data(n_rows=1000, seed=1)
+    feed(first, X.iloc[:500], scores[:500])
+    feed(second, X.iloc[500:], scores[500:])
+
+    first.merge(second)
+    report = first.report()
+    assert report['window_capacity'] == 4 * 100
+    assert report['window_size'] <= report['window_capacity']
+
+    feed(first, X, scores)
+    report = first.report()
+    assert report['window_size'] <= report['window_capacity']
+
+
+def test_merge_aligns_slots_by_age():
+    first = make_monitor(window_slots=3, slot_size=10)
+    second = make_monitor(window_slots=3, slot_size=10)
+    X, scores = make_baseline_data(n_rows=40, seed=1)
+    feed(first, X.iloc[:25], scores[:25])   # Slots by age: 5, 10, 10
+    feed(second, X.iloc[25:30], scores[25:30])   # Slots by age: 5, 0, 0
+
+    first.merge(second)
+    assert first.report()['window_size'] == 30
+
+    # Filling the merged current slot (5 + 5 of 20) rotates out only the oldest slot
+    feed(first, X.iloc[30:40], scores[30:40])
+    assert first.report()['window_size'] == 30
+
+
+def test_merge_rejects_different_window_slots():
+    X, scores = make_baseline_data()
+    with pytest.raises(ValueError):
+        DriftMonitor.from_training_data(X, scores, window_slots=4).merge(DriftMonitor.from_training_data(X, scores))
+
+
+def test_merge_rejects_different_cut_points():
+    X, scores = make_baseline_data()
+    with pytest.raises(ValueError):
+        DriftMonitor.from_training_data(X, scores).merge(DriftMonitor.from_training_data(X, scores, n_bins=5))
+    with pytest.raises(ValueError):
+        DriftMonitor.from_training_data(X, scores).merge(DriftMonitor.from_training_data(X * 2, scores))
+
+
+def test_score_must_be_last_column():
+    with pytest.raises(ValueError):
+        DriftMonitor(['score', 'age'], [[0.5], [30.0]], [[0.5, 0.5], [0.5, 0.5]])
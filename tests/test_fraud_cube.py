@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+from src.fraud_cube import FraudCube, CUBE_DIMENSIONS
+
+
+def expected_groups(df, group_by):
+    """
+    Reference roll-up computed with a pandas groupby over the raw rows.
+    """
+    grouped = df.groupby(group_by).agg(
+        fraud_count=('class', 'sum'),
+        total_count=('class', 'size'),
+        purchase_value_sum=('purchase_value', 'sum')
+    ).reset_index()
+    return {tuple(row[dim] for dim in group_by): (row['fraud_count'], row['total_count'], row['purchase_value_sum'])
+            for _, row in grouped.iterrows()}
+
+
+def cube_groups(records, group_by):
+    return {tuple(record[dim] for dim in group_by): (record['fraud_count'], record['total_count'], record['purchase_value_sum'])
+            for record in records}
+
+
+@pytest.fixture(scope='module')
+def cube(fraud_data):
+    return FraudCube.from_dataframe(fraud_data)
+
+
+def test_shape_covers_every_label(cube, fraud_data):
+    assert cube.shape == tuple(fraud_data[dim].nunique() for dim in CUBE_DIMENSIONS)
+
+
+def test_unfiltered_rollup_matches_totals(cube, fraud_data):
+    assert cube.query() == [{
+        'fraud_count': int(fraud_data['class'].sum()),
+        'total_count': len(fraud_data),
+        'purchase_value_sum': float(fraud_data['purchase_value'].sum())
+    }]
+
+
+@pytest.mark.parametrize('group_by', [['country'], ['hour_of_day'], ['browser', 'source'], ['day_of_week', 'country', 'browser']])
+def test_rollups_match_pandas_groupby(cube, fraud_data, group_by):
+    assert cube_groups(cube.query(group_by=group_by), group_by) == expected_groups(fraud_data, group_by)
+
+
+def test_group_by_order_is_preserved(cube):
+    record = cube.query(group_by=['source', 'hour_of_day'])[0]
+    assert list(record)[:2] == ['source', 'hour_of_day']
+
+
+def test_filtered_slice_matches_pandas(cube, fraud_data):
+    filters = {'country': ['Japan', 'China'], 'hour_of_day': [0, 1, 2, 23], 'source': ['SEO']}
+    mask = np.ones(len(fraud_data), dtype=bool)
+    for dim, values in filters.items():
+        mask &= fraud_data[dim].isin(values).to_numpy()
+
+    group_by = ['browser', 'country']
+    assert cube_groups(cube.query(filters, group_by), group_by) == expected_groups(fraud_data[mask], group_by)
+
+
+def test_unknown_filter_labels_select_nothing(cube):
+    assert cube.query({'country': ['Atlantis']}) == [{'fraud_count': 0, 'total_count': 0, 'purchase_value_sum': 0.0}]
+    assert cube.query({'country': ['Atlantis']}, group_by=['browser']) == []
+
+
+def test_unknown_labels_are_ignored_next_to_known_ones(cube, fraud_data):
+    total = cube.query({'country': ['Atlantis', 'Japan']})[0]['total_count']
+    assert total == int((fraud_data['country'] == 'Japan').sum())
+
+
+@pytest.mark.parametrize('group_by', [['bogus'], ['country', 'country']])
+def test_invalid_group_by_raises(cube, group_by):
+    with pytest.raises(ValueError):
+        cube.query(group_by=group_by)
+
+
+def test_incremental_updates_grow_axes(fraud_data):
+    first = fraud_data[fraud_data['country'] != 'Japan']
+    second = fraud_data[fraud_data['country'] == 'Japan']
+
+    cube = FraudCube.from_dataframe(first)
+    assert 'Japan' not in cube.labels['country']
+    cube.update(second)
+
+    assert 'Japan' in cube.labels['country']
+    group_by = ['country', 'browser']
+    assert cube_groups(cube.query(group_by=group_by), group_by) == expected_groups(fraud_data, group_by)
+
+
+def test_update_skips_rows_missing_a_dimension(fraud_data):
+    df = fraud_data.copy()
+    df.loc[:9, 'browser'] = np.nan
+    cube = FraudCube.from_dataframe(df)
+    assert cube.query()[0]['total_count'] == len(df) - 10
+
+
+def test_update_requires_measure_columns(fraud_data):
+    with pytest.raises(ValueError):
+        FraudCube().update(fraud_data.drop(columns=['purchase_value']))
+
+
+def test_from_csv_chunks_match_single_pass(tmp_path, make_fraud_data):
+    df = make_fraud_data(n_rows=1234, seed=3)
+    path = tmp_path / 'cleaned.csv'
+    df.to_csv(path, index=False)
+
+    chunked = FraudCube.from_csv(path, chunksize=100)
+    group_by = ['hour_of_day', 'country', 'source']
+    assert cube_groups(chunked.query(group_by=group_by), group_by) == expected_groups(df, group_by)
+
+
+def test_cube_endpoint_rollup_and_filters(client, fraud_data):
+    body = client.get('/fraud-stats/cube?group_by=country,source&day_of_week=5,6').get_json()
+    subset = fraud_data[fraud_data['day_of_week'].isin([5, 6])]
+    assert cube_groups(body['cells'], ['country', 'source']) == expected_groups(subset, ['country', 'source'])
+
+
+def test_stats_endpoints_apply_filters(client, fraud_data):
+    subset = fraud_data[(fraud_data['country'] == 'Japan') & fraud_data['browser'].isin(['IE', 'Opera'])]
+    summary = client.get('/fraud-stats?country=Japan&browser=IE,Opera').get_json()['summary']
+    assert summary['total_transactions'] == len(subset)
+    assert summary['fraud_cases'] == int(subset['class'].sum())
+
+    geolocation = client.get('/fraud-geolocation?browser=IE,Opera').get_json()['geolocation']
+    fraud = fraud_data[(fraud_data['class'] == 1) & fraud_data['browser'].isin(['IE', 'Opera'])]
+    assert {row['country']: row['fraud_count'] for row in geolocation} == fraud.groupby('country').size().to_dict()
+
+
+@pytest.mark.parametrize('query', ['group_by=bogus', 'group_by=country,country', 'hour_of_day=noon'])
+def test_cube_endpoint_rejects_invalid_queries(client, query):
+    response = client.get(f'/fraud-stats/cube?{query}')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_stats_stay_consistent_with_rows_missing_a_dimension(tmp_path, make_fraud_data, import_serve_model):
+    df = make_fraud_data(n_rows=2000, seed=4)
+    df.loc[df.index[:6], 'country'] = np.nan
+    df.loc[df.index[:6], 'class'] = 1
+    client = import_serve_model(tmp_path, df).app.test_client()
+
+    body = client.get('/fraud-stats?top_k=5').get_json()
+    assert body['summary']['total_transactions'] == len(df)
+    assert body['summary']['fraud_cases'] == int(df['class'].sum())
+    assert sum(row['count'] for row in body['fraud_trends']) == int(df['class'].sum())
+    assert sum(row['fraud_count'] for row in body['device_browser_fraud']) == int(df['class'].sum())
+
+    # Filtered slices come from the cube, which skips the rows missing a country
+    body = client.get('/fraud-stats?top_k=5&source=SEO,Ads,Direct').get_json()
+    assert body['summary']['total_transactions'] == len(df) - 6
+    assert sum(row['count'] for row in body['fraud_trends']) == body['summary']['fraud_cases']
+    assert sum(row['fraud_count'] for row in body['device_browser_fraud']) == body['summary']['fraud_cases']
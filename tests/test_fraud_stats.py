@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def stable_ranking(counts):
+    """
+    Reference ranking: fraud count descending, ties in group order.
+    """
+    order = np.argsort(-counts.to_numpy(), kind='stable')
+    return list(counts.index[order])
+
+
+def test_top_k_groups_matches_stable_sort(serve_model):
+    counts = serve_model.device_browser_counts
+    ranked = serve_model.top_k_groups(counts, 25)
+    assert list(counts.index[ranked]) == stable_ranking(counts)[:25]
+
+
+@pytest.mark.parametrize('k', [0, 1, 7])
+def test_top_k_groups_small_k(serve_model, k):
+    counts = serve_model.device_browser_counts
+    ranked = serve_model.top_k_groups(counts, k)
+    assert list(counts.index[ranked]) == stable_ranking(counts)[:k]
+
+
+def test_top_k_groups_k_larger_than_groups(serve_model):
+    counts = serve_model.device_browser_counts
+    ranked = serve_model.top_k_groups(counts, len(counts) + 50)
+    assert list(counts.index[ranked]) == stable_ranking(counts)
+
+
+def test_top_k_groups_breaks_ties_by_position(serve_model):
+    counts = pd.Series([3, 1, 3, 2, 3, 1], index=list('abcdef'))
+    assert list(counts.index[serve_model.top_k_groups(counts, 2)]) == ['a', 'c']
+    assert list(counts.index[serve_model.top_k_groups(counts, 4)]) == ['a', 'c', 'e', 'd']
+
+
+def test_pages_never_overlap_and_cover_stable_sort(client, serve_model):
+    counts = serve_model.device_browser_counts
+    page_size = 37
+    groups = []
+    for offset in range(0, len(counts), page_size):
+        page = client.get(f'/fraud-stats?top_k={page_size}&offset={offset}&other=false').get_json()
+        groups += [(row['device_id'], row['browser']) for row in page['device_browser_fraud']]
+
+    assert len(groups) == len(set(groups))
+    assert groups == stable_ranking(counts)
+
+
+def test_other_bucket_holds_everything_after_the_page(client, serve_model):
+    counts = serve_model.device_browser_counts
+    body = client.get('/fraud-stats?top_k=10&offset=5').get_json()
+    rows = body['device_browser_fraud']
+
+    assert rows[-1]['device_id'] == 'Other'
+    expected_other = int(counts.sum()) - int(counts[stable_ranking(counts)[:15]].sum())
+    assert rows[-1]['fraud_count'] == expected_other
+    assert body['device_browser_pagination']['other_count'] == expected_other
+    assert body['device_browser_pagination']['total_groups'] == len(counts)
+
+
+def test_no_other_bucket_when_page_covers_everything(client, serve_model):
+    counts = serve_model.device_browser_counts
+    body = client.get(f'/fraud-stats?top_k={min(len(counts), 1000)}').get_json()
+    assert all(row['device_id'] != 'Other' for row in body['device_browser_fraud'])
+    assert body['device_browser_pagination']['other_count'] == 0
+
+
+def test_top_k_zero_returns_only_other(client, serve_model):
+    rows = client.get('/fraud-stats?top_k=0').get_json()['device_browser_fraud']
+    assert rows == [{'device_id': 'Other', 'browser': 'Other', 'fraud_count': int(serve_model.device_browser_counts.sum())}]
+
+
+def test_histogram_bins_cover_every_group(client, serve_model):
+    histogram = client.get('/fraud-stats?bins=4').get_json()['device_browser_histogram']
+    assert len(histogram) == 4
+    assert sum(row['groups'] for row in histogram) == len(serve_model.device_browser_counts)
+
+
+@pytest.mark.parametrize('query', ['top_k=-1', 'top_k=1001', 'offset=-1', 'bins=-1', 'bins=201'])
+def test_out_of_range_parameters_return_400(client, query):
+    response = client.get(f'/fraud-stats?{query}')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_filtered_ranking_matches_stable_sort(client, fraud_data):
+    fraud = fraud_data[(fraud_data['class'] == 1) & fraud_data['country'].isin(['Japan', 'China'])]
+    counts = fraud.groupby(['device_id', 'browser'], sort=False).size()
+    rows = client.get('/fraud-stats?country=Japan,China&top_k=30&offset=10&other=false').get_json()['device_browser_fraud']
+    assert [(row['device_id'], row['browser']) for row in rows] == stable_ranking(counts)[10:40]
+    assert [row['fraud_count'] for row in rows] == [int(counts[group]) for group in stable_ranking(counts)[10:40]]
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.generate_synthetic_data import (
+    generate_ip_ranges, generate_fraud_data, generate_creditcard, write_dataset,
+    FRAUD_RATE, CREDITCARD_FRAUD_RATE, IPV4_SPACE
+)
+
+
+@pytest.fixture(scope='module')
+def ip_ranges():
+    return generate_ip_ranges()
+
+
+@pytest.fixture(scope='module')
+def fraud_data(ip_ranges):
+    return generate_fraud_data(100_000, ip_ranges)
+
+
+def test_ip_ranges_are_sorted_and_non_overlapping(ip_ranges):
+    lower = ip_ranges['lower_bound_ip_address'].to_numpy(dtype=np.int64)
+    upper = ip_ranges['upper_bound_ip_address'].to_numpy(dtype=np.int64)
+
+    assert len(ip_ranges) == 138846
+    assert lower[0] >= 0 and upper[-1] < IPV4_SPACE
+    assert np.all(lower <= upper)
+    assert np.all(upper[:-1] < lower[1:])
+
+
+def test_ip_ranges_cover_most_of_the_space(ip_ranges):
+    mapped = (ip_ranges['upper_bound_ip_address'] - ip_ranges['lower_bound_ip_address'] + 1).sum()
+    assert mapped / IPV4_SPACE == pytest.approx(0.85, abs=0.02)
+
+
+def test_fraud_data_schema(fraud_data):
+    assert list(fraud_data.columns) == ['user_id', 'signup_time', 'purchase_time', 'purchase_value', 'device_id',
+                                        'source', 'browser', 'sex', 'age', 'ip_address', 'class']
+    assert (pd.to_datetime(fraud_data['purchase_time']) > pd.to_datetime(fraud_data['signup_time'])).all()
+    assert fraud_data['device_id'].str.len().eq(13).all()
+
+
+def test_fraud_rate(fraud_data):
+    assert fraud_data['class'].mean() == pytest.approx(FRAUD_RATE, abs=0.005)
+
+
+def test_creditcard_fraud_rate():
+    creditcard = generate_creditcard(300_000)
+    assert list(creditcard.columns) == ['Time'] + [f'V{i}' for i in range(1, 29)] + ['Amount', 'Class']
+    assert creditcard['Class'].mean() == pytest.approx(CREDITCARD_FRAUD_RATE, abs=0.0004)
+
+
+def test_unmapped_ip_share(fraud_data, ip_ranges):
+    lower = ip_ranges['lower_bound_ip_address'].to_numpy(dtype=np.int64)
+    upper = ip_ranges['upper_bound_ip_address'].to_numpy(dtype=np.int64)
+    ip_address = fraud_data['ip_address'].to_numpy(dtype=np.int64)
+
+    index = np.searchsorted(lower, ip_address, side='right') - 1
+    mapped = (index >= 0) & (ip_address <= upper[np.maximum(index, 0)])
+    assert 1 - mapped.mean() == pytest.approx(0.15, abs=0.01)
+
+
+def test_same_seed_same_data(ip_ranges):
+    pd.testing.assert_frame_equal(generate_fraud_data(500, ip_ranges, seed=7), generate_fraud_data(500, ip_ranges, seed=7))
+
+
+def test_write_dataset_chunks(tmp_path, ip_ranges):
+    path = tmp_path / 'Fraud_Data.csv'
+    write_dataset(str(path), 2500, lambda n, offset, seed: generate_fraud_data(n, ip_ranges, start_user_id=offset, seed=seed),
+                  chunk_size=1000)
+
+    written = pd.read_csv(path)
+    assert len(written) == 2500
+    assert written['user_id'].tolist() == list(range(2500))